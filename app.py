@@ -20,7 +20,6 @@ st.set_page_config(
 # Download NLTK data on first run
 @st.cache_resource
 def download_nltk_data():
-    import nltk
     import ssl
     try:
         _create_unverified_https_context = ssl._create_unverified_context
@@ -29,18 +28,15 @@ def download_nltk_data():
     else:
         ssl._create_default_https_context = _create_unverified_https_context
     
-    for data in ['punkt', 'stopwords', 'averaged_perceptron_tagger', 'maxent_ne_chunker', 'words']:
-        try:
-            nltk.data.find(f'tokenizers/{data}')
-        except LookupError:
-            nltk.download(data, quiet=True)
+    from modules.nlp_processor import ensure_nltk_data
+    ensure_nltk_data()
 
 download_nltk_data()
 
 @st.cache_resource
 def load_spacy():
-    import spacy
-    return spacy.load("en_core_web_sm")
+    from modules.nlp_processor import load_pipeline
+    return load_pipeline()
 
 @st.cache_resource
 def load_processors():
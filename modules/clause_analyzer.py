@@ -75,21 +75,38 @@ class ClauseAnalyzer:
         """
         # Extract clauses
         clauses = self.nlp_processor.extract_clauses(text)
+        clause_texts = [clause["text"] for clause in clauses]
+        
+        # Run spaCy once over all clauses instead of once per clause
+        all_obligations = self.nlp_processor.extract_obligations_batch(clause_texts)
+        all_key_terms = self.nlp_processor.extract_key_terms_batch(clause_texts, top_n=5)
         
         analyzed_clauses = []
         
         for i, clause in enumerate(clauses):
-            analysis = self.analyze_single_clause(clause["text"], i + 1)
+            analysis = self.analyze_single_clause(
+                clause["text"], i + 1,
+                obligations=all_obligations[i],
+                key_terms=all_key_terms[i]
+            )
             analysis["clause_id"] = clause.get("clause_id", f"C{i+1}")
             analysis["original_text"] = clause["text"]
             analyzed_clauses.append(analysis)
         
         return analyzed_clauses
     
-    def analyze_single_clause(self, clause_text: str, clause_number: int) -> Dict:
+    def analyze_single_clause(self, clause_text: str, clause_number: int,
+                              obligations: Optional[Dict] = None,
+                              key_terms: Optional[List] = None) -> Dict:
         """
         Analyze a single clause
         
+        Args:
+            clause_text: Clause text to analyze
+            clause_number: Position of the clause in the contract
+            obligations: Precomputed obligations from a batched pass, if any
+            key_terms: Precomputed (term, frequency) list from a batched pass, if any
+        
         Returns:
             Dictionary with clause analysis
         """
@@ -99,7 +116,8 @@ class ClauseAnalyzer:
         clause_type = self._classify_clause_type(clause_text)
         
         # Extract obligations
-        obligations = self._extract_clause_obligations(clause_text)
+        if obligations is None:
+            obligations = self._extract_clause_obligations(clause_text)
         
         # Detect risks
         risks = self._detect_clause_risks(clause_text, clause_type)
@@ -108,7 +126,8 @@ class ClauseAnalyzer:
         ambiguities = self.nlp_processor.detect_ambiguities(clause_text)
         
         # Identify key terms
-        key_terms = self.nlp_processor.extract_key_terms(clause_text, top_n=5)
+        if key_terms is None:
+            key_terms = self.nlp_processor.extract_key_terms(clause_text, top_n=5)
         
         return {
             "clause_number": clause_number,
@@ -3,11 +3,58 @@ Entity Extractor Module
 Extracts named entities specific to legal contracts
 """
 import re
+from dataclasses import dataclass
 from typing import List, Dict
 from datetime import datetime
 import spacy
 
 
+class _Entity:
+    """Base for slotted entity records (orjson serializes them natively)"""
+    __slots__ = ()
+
+    def get(self, key: str, default=None):
+        """Dict-style field access, for callers written against dict entries"""
+        return getattr(self, key) if key in self.__slots__ else default
+
+
+@dataclass(slots=True)
+class Party(_Entity):
+    name: str
+    role: str
+    type: str
+
+
+@dataclass(slots=True)
+class DateEntity(_Entity):
+    date: str
+    format: str
+    context: str
+
+
+@dataclass(slots=True)
+class Amount(_Entity):
+    amount: str
+    currency: str
+    value: str
+    context: str
+
+
+@dataclass(slots=True)
+class Duration(_Entity):
+    duration: str
+    value: str
+    unit: str
+    context: str
+
+
+@dataclass(slots=True)
+class Jurisdiction(_Entity):
+    jurisdiction: str
+    type: str
+    context: str
+
+
 class EntityExtractor:
     """Extract contract-specific entities using pattern matching and NER"""
 
@@ -34,7 +81,7 @@ class EntityExtractor:
         
         return entities
     
-    def extract_parties(self, text: str) -> List[Dict]:
+    def extract_parties(self, text: str) -> List[Party]:
         """Extract party names from contract"""
         parties = []
         
@@ -42,59 +89,59 @@ class EntityExtractor:
         pattern1 = r'(?:between|by and between)\s+([A-Z][^,\n]+?)\s+(?:and|&)\s+([A-Z][^,\n]+?)(?:,|\.|;|\n)'
         matches = re.finditer(pattern1, text, re.IGNORECASE)
         for match in matches:
-            parties.append({
-                "name": match.group(1).strip(),
-                "role": "Party 1",
-                "type": "organization/individual"
-            })
-            parties.append({
-                "name": match.group(2).strip(),
-                "role": "Party 2",
-                "type": "organization/individual"
-            })
+            parties.append(Party(
+                name=match.group(1).strip(),
+                role="Party 1",
+                type="organization/individual"
+            ))
+            parties.append(Party(
+                name=match.group(2).strip(),
+                role="Party 2",
+                type="organization/individual"
+            ))
         
         # Pattern 2: "Party 1" or "First Party"
         party_pattern = r'(?:Party\s+(?:1|One|First)|First Party)[:\s]+([A-Z][^\n,;]+)'
         matches = re.finditer(party_pattern, text, re.IGNORECASE)
         for match in matches:
-            parties.append({
-                "name": match.group(1).strip(),
-                "role": "First Party",
-                "type": "organization/individual"
-            })
+            parties.append(Party(
+                name=match.group(1).strip(),
+                role="First Party",
+                type="organization/individual"
+            ))
         
         # Pattern 3: "hereinafter referred to as"
         referred_pattern = r'([A-Z][^,\(\n]+?)\s+\(hereinafter referred to as[^)]+\)'
         matches = re.finditer(referred_pattern, text)
         for match in matches:
-            parties.append({
-                "name": match.group(1).strip(),
-                "role": "Contracting Party",
-                "type": "organization/individual"
-            })
+            parties.append(Party(
+                name=match.group(1).strip(),
+                role="Contracting Party",
+                type="organization/individual"
+            ))
         
         # Use spaCy NER for organizations and persons
         doc = self.nlp(text[:5000])  # Process first 5000 chars
         for ent in doc.ents:
             if ent.label_ in ["ORG", "PERSON"]:
-                parties.append({
-                    "name": ent.text,
-                    "role": "Identified Entity",
-                    "type": ent.label_
-                })
+                parties.append(Party(
+                    name=ent.text,
+                    role="Identified Entity",
+                    type=ent.label_
+                ))
         
         # Deduplicate
         seen = set()
         unique_parties = []
         for party in parties:
-            name_normalized = party["name"].lower().strip()
+            name_normalized = party.name.lower().strip()
             if name_normalized not in seen and len(name_normalized) > 3:
                 seen.add(name_normalized)
                 unique_parties.append(party)
         
         return unique_parties
     
-    def extract_dates(self, text: str) -> List[Dict]:
+    def extract_dates(self, text: str) -> List[DateEntity]:
         """Extract dates from contract"""
         dates = []
         
@@ -102,45 +149,45 @@ class EntityExtractor:
         pattern1 = r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b'
         matches = re.finditer(pattern1, text)
         for match in matches:
-            dates.append({
-                "date": match.group(1),
-                "format": "numeric",
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            dates.append(DateEntity(
+                date=match.group(1),
+                format="numeric",
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Pattern 2: Month DD, YYYY
         pattern2 = r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}\b'
         matches = re.finditer(pattern2, text, re.IGNORECASE)
         for match in matches:
-            dates.append({
-                "date": match.group(0),
-                "format": "text",
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            dates.append(DateEntity(
+                date=match.group(0),
+                format="text",
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Pattern 3: DD Month YYYY (Indian format)
         pattern3 = r'\b\d{1,2}(?:st|nd|rd|th)?\s+(January|February|March|April|May|June|July|August|September|October|November|December),?\s+\d{4}\b'
         matches = re.finditer(pattern3, text, re.IGNORECASE)
         for match in matches:
-            dates.append({
-                "date": match.group(0),
-                "format": "text_indian",
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            dates.append(DateEntity(
+                date=match.group(0),
+                format="text_indian",
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Use spaCy for date entities
         doc = self.nlp(text[:5000])
         for ent in doc.ents:
             if ent.label_ == "DATE":
-                dates.append({
-                    "date": ent.text,
-                    "format": "ner",
-                    "context": self._get_context(text, ent.start_char, ent.end_char)
-                })
+                dates.append(DateEntity(
+                    date=ent.text,
+                    format="ner",
+                    context=self._get_context(text, ent.start_char, ent.end_char)
+                ))
         
         return dates
     
-    def extract_amounts(self, text: str) -> List[Dict]:
+    def extract_amounts(self, text: str) -> List[Amount]:
         """Extract monetary amounts from contract"""
         amounts = []
         
@@ -153,38 +200,38 @@ class EntityExtractor:
         for pattern in inr_patterns:
             matches = re.finditer(pattern, text, re.IGNORECASE)
             for match in matches:
-                amounts.append({
-                    "amount": match.group(0),
-                    "currency": "INR",
-                    "value": match.group(1),
-                    "context": self._get_context(text, match.start(), match.end())
-                })
+                amounts.append(Amount(
+                    amount=match.group(0),
+                    currency="INR",
+                    value=match.group(1),
+                    context=self._get_context(text, match.start(), match.end())
+                ))
         
         # USD and other currencies
         currency_pattern = r'(?:USD|US\$|\$|EUR|€|GBP|£)\s*(\d+(?:,\d+)*(?:\.\d+)?)'
         matches = re.finditer(currency_pattern, text)
         for match in matches:
-            amounts.append({
-                "amount": match.group(0),
-                "currency": "USD/Other",
-                "value": match.group(1),
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            amounts.append(Amount(
+                amount=match.group(0),
+                currency="USD/Other",
+                value=match.group(1),
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Use spaCy for money entities
         doc = self.nlp(text[:5000])
         for ent in doc.ents:
             if ent.label_ == "MONEY":
-                amounts.append({
-                    "amount": ent.text,
-                    "currency": "detected",
-                    "value": ent.text,
-                    "context": self._get_context(text, ent.start_char, ent.end_char)
-                })
+                amounts.append(Amount(
+                    amount=ent.text,
+                    currency="detected",
+                    value=ent.text,
+                    context=self._get_context(text, ent.start_char, ent.end_char)
+                ))
         
         return amounts
     
-    def extract_durations(self, text: str) -> List[Dict]:
+    def extract_durations(self, text: str) -> List[Duration]:
         """Extract time durations and periods"""
         durations = []
         
@@ -192,27 +239,27 @@ class EntityExtractor:
         duration_pattern = r'\b(\d+)\s+(year|month|week|day|hour)s?\b'
         matches = re.finditer(duration_pattern, text, re.IGNORECASE)
         for match in matches:
-            durations.append({
-                "duration": match.group(0),
-                "value": match.group(1),
-                "unit": match.group(2),
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            durations.append(Duration(
+                duration=match.group(0),
+                value=match.group(1),
+                unit=match.group(2),
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Pattern: Term of X
         term_pattern = r'(?:term|period|duration)\s+of\s+(\d+\s+(?:year|month|week|day)s?)'
         matches = re.finditer(term_pattern, text, re.IGNORECASE)
         for match in matches:
-            durations.append({
-                "duration": match.group(1),
-                "value": match.group(1).split()[0],
-                "unit": match.group(1).split()[1],
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            durations.append(Duration(
+                duration=match.group(1),
+                value=match.group(1).split()[0],
+                unit=match.group(1).split()[1],
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         return durations
     
-    def extract_jurisdictions(self, text: str) -> List[Dict]:
+    def extract_jurisdictions(self, text: str) -> List[Jurisdiction]:
         """Extract jurisdiction and governing law information"""
         jurisdictions = []
         
@@ -228,38 +275,38 @@ class EntityExtractor:
         jurisdiction_pattern = r'(?:jurisdiction|courts? of|governed by (?:the )?laws? of)\s+([A-Z][^,\.\n]+)'
         matches = re.finditer(jurisdiction_pattern, text, re.IGNORECASE)
         for match in matches:
-            jurisdictions.append({
-                "jurisdiction": match.group(1).strip(),
-                "type": "specified",
-                "context": self._get_context(text, match.start(), match.end())
-            })
+            jurisdictions.append(Jurisdiction(
+                jurisdiction=match.group(1).strip(),
+                type="specified",
+                context=self._get_context(text, match.start(), match.end())
+            ))
         
         # Look for Indian locations
         for location in indian_locations:
             pattern = r'\b' + location + r'\b'
             matches = re.finditer(pattern, text, re.IGNORECASE)
             for match in matches:
-                jurisdictions.append({
-                    "jurisdiction": location,
-                    "type": "location",
-                    "context": self._get_context(text, match.start(), match.end())
-                })
+                jurisdictions.append(Jurisdiction(
+                    jurisdiction=location,
+                    type="location",
+                    context=self._get_context(text, match.start(), match.end())
+                ))
         
         # Use spaCy for GPE (Geopolitical Entity)
         doc = self.nlp(text[:5000])
         for ent in doc.ents:
             if ent.label_ == "GPE":
-                jurisdictions.append({
-                    "jurisdiction": ent.text,
-                    "type": "ner",
-                    "context": self._get_context(text, ent.start_char, ent.end_char)
-                })
+                jurisdictions.append(Jurisdiction(
+                    jurisdiction=ent.text,
+                    type="ner",
+                    context=self._get_context(text, ent.start_char, ent.end_char)
+                ))
         
         # Deduplicate
         seen = set()
         unique_jurisdictions = []
         for jur in jurisdictions:
-            jur_normalized = jur["jurisdiction"].lower().strip()
+            jur_normalized = jur.jurisdiction.lower().strip()
             if jur_normalized not in seen:
                 seen.add(jur_normalized)
                 unique_jurisdictions.append(jur)
@@ -3,20 +3,31 @@ Multilingual Handler Module
 Handles Hindi and multilingual contract processing
 """
 import re
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from langdetect import detect, detect_langs
 import warnings
 
+try:
+    import fasttext
+    _FASTTEXT_AVAILABLE = True
+except ImportError:
+    _FASTTEXT_AVAILABLE = False
+
 warnings.filterwarnings('ignore')
 
 
 class MultilingualHandler:
     """Handle multilingual contracts (English and Hindi)"""
     
-    def __init__(self):
+    def __init__(self, lid_model_path: str = "lid.176.ftz"):
         """Initialize multilingual handler"""
         self.supported_languages = ['en', 'hi']
         
+        # fastText language-ID model, loaded on first use
+        self.lid_model_path = lid_model_path
+        self._lid = None
+        self._lid_failed = not _FASTTEXT_AVAILABLE
+        
         # Hindi to English translation mappings for common contract terms
         self.hindi_terms = {
             # Contract terms
@@ -83,19 +94,10 @@ class MultilingualHandler:
             }
         
         try:
-            # Detect primary language
-            primary_lang = detect(text)
-            
-            # Detect all languages with probabilities
-            lang_probs = detect_langs(text)
-            
-            languages = [
-                {
-                    "lang": str(lang_prob).split(':')[0],
-                    "confidence": float(str(lang_prob).split(':')[1])
-                }
-                for lang_prob in lang_probs
-            ]
+            detected = self._detect_with_fasttext(text)
+            if detected is None:
+                detected = self._detect_with_langdetect(text)
+            primary_lang, languages = detected
             
             # Check if multilingual
             is_multilingual = len(languages) > 1 and languages[1]["confidence"] > 0.2
@@ -126,6 +128,55 @@ class MultilingualHandler:
                 "error": str(e)
             }
     
+    def _detect_with_fasttext(self, text: str) -> Optional[Tuple[str, List[Dict]]]:
+        """Primary language and top-3 candidates from fastText, or None to use langdetect"""
+        lid = self._get_lid_model()
+        if lid is None:
+            return None
+        
+        try:
+            # fastText expects a single line of text
+            labels, probs = lid.predict(text.replace("\n", " "), k=3)
+        except Exception:
+            # Unusual input or a model file predict cannot handle - fall back to langdetect
+            return None
+        
+        languages = [
+            {
+                "lang": label.replace("__label__", ""),
+                "confidence": min(1.0, float(prob))
+            }
+            for label, prob in zip(labels, probs)
+        ]
+        return (languages[0]["lang"] if languages else "unknown"), languages
+    
+    def _detect_with_langdetect(self, text: str) -> Tuple[str, List[Dict]]:
+        """Primary language and candidates with probabilities from langdetect"""
+        # Detect primary language
+        primary_lang = detect(text)
+        
+        # Detect all languages with probabilities
+        lang_probs = detect_langs(text)
+        
+        languages = [
+            {
+                "lang": str(lang_prob).split(':')[0],
+                "confidence": float(str(lang_prob).split(':')[1])
+            }
+            for lang_prob in lang_probs
+        ]
+        return primary_lang, languages
+    
+    def _get_lid_model(self):
+        """Load the fastText language-ID model once, or None to use langdetect"""
+        if self._lid is None and not self._lid_failed:
+            try:
+                self._lid = fasttext.load_model(self.lid_model_path)
+            except Exception:
+                # Model file missing or unreadable - fall back to langdetect
+                self._lid_failed = True
+        return self._lid
+    
     def normalize_text(self, text: str) -> str:
         """
         Normalize multilingual text for processing
@@ -2,43 +2,443 @@
 NLP Processor Module
 Handles text preprocessing, sentence segmentation, and basic NLP tasks
 """
+import os
 import re
-from typing import List, Dict, Tuple
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from collections import Counter
+from collections.abc import Mapping
+from typing import List, Dict, Tuple, Union
+import numpy as np
 import spacy
+from spacy.attrs import POS, LEMMA, LOWER, IS_STOP, IS_ALPHA, LENGTH, ORTH, IS_SPACE
 from spacy.lang.en import English
+from spacy.symbols import NOUN, PROPN, ADJ
+from spacy.tokens import Doc
+from spacy.matcher import PhraseMatcher
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 import warnings
 
+try:
+    from numba import njit, types
+    from numba.typed import Dict as NumbaDict
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 warnings.filterwarnings('ignore')
 
+# Components skipped when only sentence boundaries are needed (the parser sets them)
+SENTENCE_DISABLE = ("tagger", "attribute_ruler", "lemmatizer", "ner")
+
+# Components skipped when only POS tags and lemmas are needed
+TAGGING_DISABLE = ("parser", "ner")
+
+# Documents per nlp.pipe() batch
+PIPE_BATCH_SIZE = 64
+
+# Numbered ("1.", "2.1") and lettered ("a)") clauses in one pass. Each body
+# consumes characters up to the next clause marker, which keeps matching
+# linear instead of backtracking through a lazy body and a lookahead.
+_CLAUSE_SPLIT_PATTERN = re.compile(
+    r'(?:^|\n)(?:'
+    r'(?P<num>\d+\.(?:\d+\.?)*)\s+(?P<num_body>[A-Z](?:(?!\n\d+\.|\n[a-z]\)|\n[A-Z]{3,}).)+)'
+    r'|(?P<let>[a-z]\))\s+(?P<let_body>(?:(?!\n[a-z]\)|\n\d+\.).)+)'
+    r')',
+    re.MULTILINE | re.DOTALL
+)
+
+# Keyword alternatives for each clause type, in priority order
+CLAUSE_TYPE_KEYWORDS = {
+    "Payment Terms": r'payment|fee|compensation|remuneration|salary|invoice|due|price|cost',
+    "Termination": r'terminat|cancel|end|expire|cessation|dissolve',
+    "Indemnity": r'indemnif|hold harmless|defend|protect|compensate for loss',
+    "Confidentiality": r'confidential|secret|proprietary|non-disclosure|nda',
+    "Intellectual Property": r'intellectual property|copyright|patent|trademark|ip rights|ownership',
+    "Liability": r'liabilit|responsib|damages|liable|accountable',
+    "Dispute Resolution": r'dispute|arbitration|mediation|litigation|court|jurisdiction',
+    "Force Majeure": r'force majeure|act of god|unforeseeable|beyond control',
+    "Warranties": r'warrant|guarantee|represent|assure|certif',
+    "Non-compete": r'non-compete|non-competition|restrictive covenant|compete',
+    "Duration": r'term|duration|period|commence|effective date',
+    "Renewal": r'renew|extend|continuation|auto-renew',
+}
+
+# All clause types as one alternation, one named group per type. The leftmost
+# match is not necessarily the highest priority type, so callers scan every
+# match and keep the lowest priority index.
+_GROUP_TO_TYPE = {
+    f"t{priority}": clause_type
+    for priority, clause_type in enumerate(CLAUSE_TYPE_KEYWORDS)
+}
+_CLAUSE_TYPE_PATTERN = re.compile(
+    r'\b(?:' + "|".join(
+        f"(?P<t{priority}>{keywords})"
+        for priority, keywords in enumerate(CLAUSE_TYPE_KEYWORDS.values())
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+# Ambiguous language as one alternation so the text is scanned once.
+# "efforts" precedes "vague" so "reasonable efforts" wins over "reasonable".
+_AMBIGUITY_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<efforts>best efforts|reasonable efforts)'
+    r'|(?P<vague>reasonable|appropriate|suitable|adequate|sufficient|substantial)'
+    r'|(?P<modal>may|might|could|should|would)'
+    r'|(?P<approx>approximately|about|around|roughly|nearly)'
+    r'|(?P<time>promptly|timely|soon|expeditiously)'
+    r'|(?P<material>material|significant)'
+    r')\b',
+    re.IGNORECASE
+)
+
+_AMBIGUITY_REASONS = {
+    "efforts": "Undefined effort standard",
+    "vague": "Vague or subjective term",
+    "modal": "Permissive or conditional wording",
+    "approx": "Approximate quantity or value",
+    "time": "Undefined time frame",
+    "material": "Undefined materiality threshold",
+}
+
+# Common section headers in contracts, matched anywhere in an uppercased line
+SECTION_HEADERS = (
+    "DEFINITIONS",
+    "PARTIES",
+    "RECITALS",
+    "TERMS AND CONDITIONS",
+    "PAYMENT",
+    "TERMINATION",
+    "CONFIDENTIALITY",
+    "INTELLECTUAL PROPERTY",
+    "LIABILITY",
+    "INDEMNITY",
+    "DISPUTE RESOLUTION",
+    "GENERAL PROVISIONS",
+    "SIGNATURES"
+)
+_SECTION_HEADER_PATTERN = re.compile("|".join(re.escape(header) for header in SECTION_HEADERS))
+
+# Keywords for obligations, rights, and prohibitions
+OBLIGATION_KEYWORDS = ('shall', 'must', 'will', 'agrees to', 'required to', 'obligated to')
+RIGHTS_KEYWORDS = ('may', 'entitled to', 'has the right', 'permitted to', 'can')
+PROHIBITION_KEYWORDS = ('shall not', 'must not', 'prohibited', 'forbidden', 'may not')
+
+
+def _split_keywords(keywords) -> Tuple[frozenset, frozenset]:
+    """Split keyword phrases into a set of single words and a set of word tuples"""
+    words = frozenset(keyword for keyword in keywords if " " not in keyword)
+    phrases = frozenset(tuple(keyword.split()) for keyword in keywords if " " in keyword)
+    return words, phrases
+
+
+_OBLIGATION_WORDS, _OBLIGATION_PHRASES = _split_keywords(OBLIGATION_KEYWORDS)
+_RIGHTS_WORDS, _RIGHTS_PHRASES = _split_keywords(RIGHTS_KEYWORDS)
+_PROHIBITION_WORDS, _PROHIBITION_PHRASES = _split_keywords(PROHIBITION_KEYWORDS)
+
+
+# NLTK data packages and the resource path nltk.data.find checks for each
+NLTK_DATA_PATHS = {
+    "punkt": "tokenizers/punkt",
+    "stopwords": "corpora/stopwords",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "maxent_ne_chunker": "chunkers/maxent_ne_chunker",
+    "words": "corpora/words",
+}
+
+
+# Token attributes read by the key-term counter, in column order
+_TERM_ATTRS = [POS, LEMMA, IS_STOP, IS_ALPHA, LENGTH]
+
+
+def _count_term_ids_numpy(arr: np.ndarray) -> Dict[int, int]:
+    """Count content-word lemma ids, keyed in order of first occurrence"""
+    mask = (
+        np.isin(arr[:, 0], (NOUN, PROPN, ADJ))
+        & (arr[:, 2] == 0)
+        & (arr[:, 3] == 1)
+        & (arr[:, 4] > 2)
+    )
+    lemma_ids, first_index, counts = np.unique(
+        arr[mask, 1], return_index=True, return_counts=True
+    )
+    order = np.argsort(first_index)
+    return dict(zip(lemma_ids[order].tolist(), counts[order].tolist()))
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _count_term_ids_numba(arr, noun_id, propn_id, adj_id):
+        """
+        Count content-word lemma ids in one compiled pass over the token array
+        
+        Takes the token array viewed as int64, since lemma hashes use all 64
+        bits and a uint64-keyed typed Dict cannot hand keys >= 2**63 back to
+        Python. Returns parallel (ids, counts) arrays in first-occurrence order.
+        """
+        slots = NumbaDict.empty(key_type=types.int64, value_type=types.int64)
+        ids = np.empty(arr.shape[0], dtype=np.int64)
+        counts = np.zeros(arr.shape[0], dtype=np.int64)
+        n = 0
+        for i in range(arr.shape[0]):
+            pos = arr[i, 0]
+            if ((pos == noun_id or pos == propn_id or pos == adj_id)
+                    and arr[i, 2] == 0 and arr[i, 3] == 1 and arr[i, 4] > 2):
+                lemma_id = arr[i, 1]
+                if lemma_id in slots:
+                    counts[slots[lemma_id]] += 1
+                else:
+                    slots[lemma_id] = n
+                    ids[n] = lemma_id
+                    counts[n] = 1
+                    n += 1
+        return ids[:n], counts[:n]
+
+
+def _count_term_ids(arr: np.ndarray) -> Dict[int, int]:
+    """Count content-word lemma ids, using the Numba kernel when available"""
+    if _NUMBA_AVAILABLE:
+        ids, counts = _count_term_ids_numba(
+            np.ascontiguousarray(arr, dtype=np.uint64).view(np.int64), NOUN, PROPN, ADJ
+        )
+        return dict(zip(ids.view(np.uint64).tolist(), counts.tolist()))
+    return _count_term_ids_numpy(arr)
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_nltk_data() -> None:
+    """Download any missing NLTK data packages; runs once per process"""
+    for package, path in NLTK_DATA_PATHS.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(package, quiet=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _stopwords() -> frozenset:
+    """English NLTK stopwords, loaded from disk once per process"""
+    ensure_nltk_data()
+    return frozenset(stopwords.words("english"))
+
+
+# (model, exclude) of every pipeline returned by load_pipeline, keyed by id().
+# Cached pipelines live for the whole process, so the ids stay valid.
+_PIPELINE_ARGS: Dict[int, Tuple[str, Tuple[str, ...]]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def load_pipeline(model: str = "en_core_web_sm", exclude: Tuple[str, ...] = ()):
+    """Load a spaCy pipeline once per process for a given set of excluded components"""
+    nlp = spacy.load(model, exclude=list(exclude))
+    _PIPELINE_ARGS[id(nlp)] = (model, exclude)
+    return nlp
+
+
+class TokensView:
+    """
+    Sequence-like view of a doc's non-space token strings
+    
+    Holds only the ORTH ids; strings are resolved from the vocab as the
+    view is iterated.
+    """
+    
+    __slots__ = ("_ids", "_strings")
+    
+    def __init__(self, ids: np.ndarray, strings):
+        self._ids = ids
+        self._strings = strings
+    
+    @classmethod
+    def from_doc(cls, doc: Doc) -> "TokensView":
+        arr = doc.to_array([ORTH, IS_SPACE])
+        return cls(arr[arr[:, 1] == 0, 0], doc.vocab.strings)
+    
+    def __iter__(self):
+        strings = self._strings
+        for orth in self._ids.tolist():
+            yield strings[orth]
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, "TokensView"]:
+        if isinstance(index, slice):
+            return TokensView(self._ids[index], self._strings)
+        return self._strings[int(self._ids[index])]
+    
+    def tolist(self) -> List[str]:
+        """Materialize the token strings as a list"""
+        strings = self._strings
+        return [strings[orth] for orth in self._ids.tolist()]
+
+
+class LazyFeatures(Mapping):
+    """
+    Read-only mapping of the linguistic features of a spaCy doc
+    
+    Each feature's strings are built the first time it is read, so callers
+    that only need sentences never pay for the rest. With keep_doc=False the
+    character spans of every feature are copied out of the doc up front and
+    the doc is dropped at once, so the result never holds the parse.
+    """
+    
+    _FEATURE_KEYS = ("sentences", "tokens", "entities", "noun_phrases")
+    
+    def __init__(self, doc: Doc, keep_doc: bool = True):
+        self.doc = doc  # Store spaCy doc for further processing
+        self._text = doc.text
+        self._strings = doc.vocab.strings
+        if keep_doc:
+            self._keys = self._FEATURE_KEYS + ("doc",)
+        else:
+            self._keys = self._FEATURE_KEYS
+            # Copy everything the features read out of the doc, then drop it
+            for name in ("tokens", "_sentence_spans", "_entity_spans", "_noun_chunk_spans"):
+                getattr(self, name)
+            self.doc = None
+    
+    @functools.cached_property
+    def _sentence_spans(self) -> List[Tuple[int, int]]:
+        return [(sent.start_char, sent.end_char) for sent in self.doc.sents]
+    
+    @functools.cached_property
+    def _entity_spans(self) -> List[Tuple[int, int, int]]:
+        return [(ent.start_char, ent.end_char, ent.label) for ent in self.doc.ents]
+    
+    @functools.cached_property
+    def _noun_chunk_spans(self) -> List[Tuple[int, int]]:
+        return [(chunk.start_char, chunk.end_char) for chunk in self.doc.noun_chunks]
+    
+    @functools.cached_property
+    def sentences(self) -> List[str]:
+        text = self._text
+        return [sent for start, end in self._sentence_spans if (sent := text[start:end].strip())]
+    
+    @functools.cached_property
+    def tokens(self) -> TokensView:
+        return TokensView.from_doc(self.doc)
+    
+    @functools.cached_property
+    def entities(self) -> List[Dict]:
+        text = self._text
+        strings = self._strings
+        return [
+            {
+                "text": text[start:end],
+                "label": strings[label],
+                "start": start,
+                "end": end
+            }
+            for start, end, label in self._entity_spans
+        ]
+    
+    @functools.cached_property
+    def noun_phrases(self) -> List[str]:
+        text = self._text
+        return [text[start:end] for start, end in self._noun_chunk_spans]
+    
+    def __getitem__(self, key: str):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def to_dict(self) -> Dict:
+        """Materialize every feature except the doc as plain Python values"""
+        return {
+            "sentences": self.sentences,
+            "tokens": self.tokens.tolist(),
+            "entities": self.entities,
+            "noun_phrases": self.noun_phrases
+        }
+
+
+# Per-process NLPProcessor used by process_corpus workers
+_WORKER_PROCESSOR = None
+
+
+def _worker_init(model: str, exclude: Tuple[str, ...]):
+    """Load the parent's spaCy pipeline once in each corpus worker process"""
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = NLPProcessor(load_pipeline(model, exclude))
+
+
+def _process_one(text: str) -> Dict:
+    """Process one corpus text in a worker into plain values, so results pickle cheaply"""
+    features = _WORKER_PROCESSOR.process_text(text)
+    return features.to_dict() if isinstance(features, LazyFeatures) else features
+
 
 class NLPProcessor:
     """Process text using spaCy and NLTK"""
 
     def __init__(self, nlp=None):
         """Initialize NLP models"""
-        self.nlp = nlp
+        self.nlp = nlp if nlp is not None else load_pipeline()
         self.nlp.max_length = 2_000_000
-
-        # NLTK components (data already downloaded in setup.sh)
-        from nltk.corpus import stopwords
-        self.stop_words = set(stopwords.words("english"))
+        
+        # Clause type keywords: single words as LOWER ids, phrases via a matcher
+        (self._clause_word_ids, self._clause_word_types,
+         self.clause_type_matcher) = self._build_clause_type_index()
+        
+        # NLTK components (shared by every instance in the process)
+        self.stop_words = _stopwords()
+    
+    def _build_clause_type_index(self) -> Tuple[np.ndarray, np.ndarray, PhraseMatcher]:
+        """Index CLAUSE_TYPE_KEYWORDS by token id, tagging each with its type priority"""
+        word_ids, word_types = [], []
+        matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+        for priority, keywords in enumerate(CLAUSE_TYPE_KEYWORDS.values()):
+            phrases = []
+            for keyword in keywords.split("|"):
+                keyword_doc = self.nlp.make_doc(keyword)
+                if len(keyword_doc) == 1:
+                    word_ids.append(self.nlp.vocab.strings.add(keyword))
+                    word_types.append(priority)
+                else:
+                    phrases.append(keyword_doc)
+            if phrases:
+                matcher.add(f"t{priority}", phrases)
+        
+        return (np.array(word_ids, dtype=np.uint64),
+                np.array(word_types, dtype=np.intp),
+                matcher)
+    
+    def _get_doc(self, text: str, disable: Tuple[str, ...] = ()) -> Doc:
+        """
+        Parse text with the given pipeline components disabled
+        
+        Nothing is cached on the processor, which is shared across sessions;
+        to reuse a parse, get it from process_text(text, keep_doc=True) and
+        pass the doc to extract_obligations / extract_key_terms.
+        """
+        return self.nlp(text, disable=disable)
     
     def _download_nltk_data(self):
-        """NLTK data already downloaded in setup.sh"""
-        pass
+        """Make sure NLTK data is available (checked once per process)"""
+        ensure_nltk_data()
     
-    def process_text(self, text: str) -> Dict:
+    def process_text(self, text: str, keep_doc: bool = False) -> Mapping:
         """
         Process text and extract linguistic features
         
         Args:
             text: Input text to process
+            keep_doc: Include the spaCy doc in the result and keep it alive.
+                Otherwise the result copies the spans it needs and drops
+                the doc before returning.
             
         Returns:
-            Dict containing sentences, tokens, and other features
+            Lazy mapping of sentences, tokens (a TokensView), and other features
         """
         if not text or not text.strip():
             return {
@@ -49,35 +449,61 @@ class NLPProcessor:
             }
         
         # Process with spaCy
-        doc = self.nlp(text)
+        doc = self._get_doc(text)
         
-        # Extract sentences
-        sentences = [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+        return self._features_from_doc(doc, keep_doc)
+    
+    def process_texts(self, texts: List[str], keep_doc: bool = False) -> List[Mapping]:
+        """
+        Process many texts in one batched spaCy pass
         
-        # Extract tokens
-        tokens = [token.text for token in doc if not token.is_space]
+        Returns:
+            List of feature mappings in the same order as texts
+        """
+        results = []
+        for doc in self.nlp.pipe(texts, batch_size=PIPE_BATCH_SIZE):
+            if not doc.text.strip():
+                results.append({
+                    "sentences": [],
+                    "tokens": [],
+                    "entities": [],
+                    "noun_phrases": []
+                })
+            else:
+                results.append(self._features_from_doc(doc, keep_doc))
         
-        # Extract named entities
-        entities = [
-            {
-                "text": ent.text,
-                "label": ent.label_,
-                "start": ent.start_char,
-                "end": ent.end_char
-            }
-            for ent in doc.ents
-        ]
+        return results
+    
+    def process_corpus(self, texts: List[str], max_workers: int = None) -> List[Dict]:
+        """
+        Process many independent documents in parallel worker processes
         
-        # Extract noun phrases
-        noun_phrases = [chunk.text for chunk in doc.noun_chunks]
+        Each worker loads the same model with the same excluded components
+        as this processor's pipeline, once. A pipeline that did not come
+        from load_pipeline cannot be rebuilt in a worker, so its texts are
+        processed in this process instead. Results do not include the
+        spaCy doc.
         
-        return {
-            "sentences": sentences,
-            "tokens": tokens,
-            "entities": entities,
-            "noun_phrases": noun_phrases,
-            "doc": doc  # Store spaCy doc for further processing
-        }
+        Returns:
+            List of feature dicts in the same order as texts
+        """
+        pipeline_args = _PIPELINE_ARGS.get(id(self.nlp))
+        if pipeline_args is None:
+            return [
+                features.to_dict() if isinstance(features, LazyFeatures) else features
+                for features in self.process_texts(texts)
+            ]
+        
+        if max_workers is None:
+            max_workers = max(1, (os.cpu_count() or 2) - 1)
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init,
+                                 initargs=pipeline_args) as executor:
+            return list(executor.map(_process_one, texts, chunksize=8))
+    
+    def _features_from_doc(self, doc, keep_doc: bool = False) -> Mapping:
+        """Wrap a processed doc in a lazy feature view"""
+        return LazyFeatures(doc, keep_doc)
     
     def extract_clauses(self, text: str) -> List[Dict]:
         """
@@ -88,33 +514,20 @@ class NLPProcessor:
         """
         clauses = []
         
-        # Split by numbered sections
-        numbered_pattern = r'(?:^|\n)(\d+\.(?:\d+\.?)*)\s+([A-Z][^\n]+?)(?=\n\d+\.|\n[A-Z]{3,}|\Z)'
-        matches = re.finditer(numbered_pattern, text, re.MULTILINE | re.DOTALL)
-        
-        for match in matches:
-            clause_num = match.group(1)
-            clause_text = match.group(2).strip()
-            
-            clauses.append({
-                "clause_id": clause_num,
-                "text": clause_text,
-                "type": "numbered"
-            })
-        
-        # Split by lettered sections
-        lettered_pattern = r'(?:^|\n)([a-z]\))\s+([^\n]+?)(?=\n[a-z]\)|\n\d+\.|\Z)'
-        matches = re.finditer(lettered_pattern, text, re.MULTILINE | re.DOTALL)
-        
-        for match in matches:
-            clause_id = match.group(1)
-            clause_text = match.group(2).strip()
-            
-            clauses.append({
-                "clause_id": clause_id,
-                "text": clause_text,
-                "type": "lettered"
-            })
+        # Split by numbered and lettered sections
+        for match in _CLAUSE_SPLIT_PATTERN.finditer(text):
+            if match.group("num") is not None:
+                clauses.append({
+                    "clause_id": match.group("num"),
+                    "text": match.group("num_body").strip(),
+                    "type": "numbered"
+                })
+            else:
+                clauses.append({
+                    "clause_id": match.group("let"),
+                    "text": match.group("let_body").strip(),
+                    "type": "lettered"
+                })
         
         # If no structured clauses found, split by paragraphs
         if not clauses:
@@ -129,69 +542,98 @@ class NLPProcessor:
         
         return clauses
     
-    def identify_clause_type(self, clause_text: str) -> str:
+    def identify_clause_type(self, clause_text: str, doc: Doc = None) -> str:
         """
         Identify the type of clause based on keywords
         
+        Args:
+            clause_text: Clause text to classify
+            doc: Optional Doc already produced for this clause; skips the regex scan
+        
         Returns:
             Clause type as string
         """
-        clause_lower = clause_text.lower()
-        
-        # Define keyword patterns for each clause type
-        clause_patterns = {
-            "Payment Terms": r'\b(payment|fee|compensation|remuneration|salary|invoice|due|price|cost)\b',
-            "Termination": r'\b(terminat|cancel|end|expire|cessation|dissolve)\b',
-            "Indemnity": r'\b(indemnif|hold harmless|defend|protect|compensate for loss)\b',
-            "Confidentiality": r'\b(confidential|secret|proprietary|non-disclosure|nda)\b',
-            "Intellectual Property": r'\b(intellectual property|copyright|patent|trademark|ip rights|ownership)\b',
-            "Liability": r'\b(liabilit|responsib|damages|liable|accountable)\b',
-            "Dispute Resolution": r'\b(dispute|arbitration|mediation|litigation|court|jurisdiction)\b',
-            "Force Majeure": r'\b(force majeure|act of god|unforeseeable|beyond control)\b',
-            "Warranties": r'\b(warrant|guarantee|represent|assure|certif)\b',
-            "Non-compete": r'\b(non-compete|non-competition|restrictive covenant|compete)\b',
-            "Duration": r'\b(term|duration|period|commence|effective date)\b',
-            "Renewal": r'\b(renew|extend|continuation|auto-renew)\b',
-        }
-        
-        # Check each pattern
-        for clause_type, pattern in clause_patterns.items():
-            if re.search(pattern, clause_lower):
-                return clause_type
+        if doc is not None:
+            return self._clause_type_from_doc(doc)
+        
+        best = None
+        for match in _CLAUSE_TYPE_PATTERN.finditer(clause_text):
+            priority = match.lastindex - 1
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
         
-        return "General Provisions"
+        if best is None:
+            return "General Provisions"
+        return _GROUP_TO_TYPE[f"t{best}"]
     
-    def extract_obligations(self, text: str) -> Dict[str, List[str]]:
+    def _clause_type_from_doc(self, doc: Doc) -> str:
+        """Classify a clause from its token ids, without a regex pass"""
+        present = np.isin(self._clause_word_ids, doc.to_array(LOWER))
+        priorities = self._clause_word_types[present]
+        best = int(priorities.min()) if priorities.size else None
+        
+        for match_id, _, _ in self.clause_type_matcher(doc):
+            priority = int(self.nlp.vocab.strings[match_id][1:])
+            if best is None or priority < best:
+                best = priority
+        
+        if best is None:
+            return "General Provisions"
+        return _GROUP_TO_TYPE[f"t{best}"]
+    
+    def extract_obligations(self, text: str, doc: Doc = None) -> Dict[str, List[str]]:
         """
         Extract obligations, rights, and prohibitions from text
         
+        Args:
+            text: Input text
+            doc: Optional Doc already produced by process_text for this text
+        
         Returns:
             Dict with categories and extracted items
         """
-        doc = self.nlp(text)
+        if doc is None:
+            doc = self._get_doc(text, SENTENCE_DISABLE)
         
+        return self._obligations_from_doc(doc)
+    
+    def extract_obligations_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """
+        Extract obligations, rights, and prohibitions from many texts in one batched pass
+        
+        Returns:
+            List of obligation dicts in the same order as texts
+        """
+        docs = self.nlp.pipe(texts, batch_size=PIPE_BATCH_SIZE, disable=SENTENCE_DISABLE)
+        return [self._obligations_from_doc(doc) for doc in docs]
+    
+    def _obligations_from_doc(self, doc) -> Dict[str, List[str]]:
+        """Classify the sentences of a processed doc into obligations, rights, and prohibitions"""
         obligations = []
         rights = []
         prohibitions = []
         
-        # Patterns for obligations
-        obligation_keywords = ['shall', 'must', 'will', 'agrees to', 'required to', 'obligated to']
-        rights_keywords = ['may', 'entitled to', 'has the right', 'permitted to', 'can']
-        prohibition_keywords = ['shall not', 'must not', 'prohibited', 'forbidden', 'may not']
-        
         for sent in doc.sents:
-            sent_text = sent.text.strip()
-            sent_lower = sent_text.lower()
+            # Lowercased words and word pairs/triples, built once per sentence
+            words = [token.lower_ for token in sent]
+            word_set = set(words)
+            ngrams = set(zip(words, words[1:]))
+            ngrams.update(zip(words, words[1:], words[2:]))
             
             # Check for prohibitions first (more specific)
-            if any(keyword in sent_lower for keyword in prohibition_keywords):
-                prohibitions.append(sent_text)
+            if (not _PROHIBITION_WORDS.isdisjoint(word_set)
+                    or not _PROHIBITION_PHRASES.isdisjoint(ngrams)):
+                prohibitions.append(sent.text.strip())
             # Then check for obligations
-            elif any(keyword in sent_lower for keyword in obligation_keywords):
-                obligations.append(sent_text)
+            elif (not _OBLIGATION_WORDS.isdisjoint(word_set)
+                    or not _OBLIGATION_PHRASES.isdisjoint(ngrams)):
+                obligations.append(sent.text.strip())
             # Finally check for rights
-            elif any(keyword in sent_lower for keyword in rights_keywords):
-                rights.append(sent_text)
+            elif (not _RIGHTS_WORDS.isdisjoint(word_set)
+                    or not _RIGHTS_PHRASES.isdisjoint(ngrams)):
+                rights.append(sent.text.strip())
         
         return {
             "obligations": obligations,
@@ -208,54 +650,58 @@ class NLPProcessor:
         """
         ambiguities = []
         
-        # Patterns for ambiguous language
-        ambiguous_patterns = [
-            r'\b(reasonable|appropriate|suitable|adequate|sufficient|substantial)\b',
-            r'\b(may|might|could|should|would)\b',
-            r'\b(approximately|about|around|roughly|nearly)\b',
-            r'\b(promptly|timely|soon|expeditiously)\b',
-            r'\b(best efforts|reasonable efforts)\b',
-            r'\b(material|significant|substantial)\b',
-        ]
-        
-        for pattern in ambiguous_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Get context (50 chars before and after)
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
-                
-                ambiguities.append({
-                    "phrase": match.group(0),
-                    "context": context,
-                    "position": match.start(),
-                    "reason": "Vague or subjective term"
-                })
+        for match in _AMBIGUITY_PATTERN.finditer(text):
+            # Get context (50 chars before and after)
+            start = max(0, match.start() - 50)
+            end = min(len(text), match.end() + 50)
+            context = text[start:end]
+            
+            ambiguities.append({
+                "phrase": match.group(0),
+                "context": context,
+                "position": match.start(),
+                "reason": _AMBIGUITY_REASONS[match.lastgroup]
+            })
         
         return ambiguities
     
-    def extract_key_terms(self, text: str, top_n: int = 20) -> List[Tuple[str, int]]:
+    def extract_key_terms(self, doc_or_text: Union[str, Doc], top_n: int = 20) -> List[Tuple[str, int]]:
         """
         Extract key terms from text using TF-IDF-like approach
         
+        Args:
+            doc_or_text: Raw text, or a spaCy Doc already produced by process_text
+            top_n: Number of terms to return
+        
         Returns:
             List of (term, frequency) tuples
         """
-        doc = self.nlp(text.lower())
+        if isinstance(doc_or_text, Doc):
+            doc = doc_or_text
+        else:
+            doc = self._get_doc(doc_or_text, TAGGING_DISABLE)
         
-        # Extract meaningful terms (nouns, proper nouns, adjectives)
-        terms = []
-        for token in doc:
-            if (token.pos_ in ['NOUN', 'PROPN', 'ADJ'] and 
-                not token.is_stop and 
-                len(token.text) > 2 and
-                token.is_alpha):
-                terms.append(token.lemma_)
+        return self._key_terms_from_doc(doc, top_n)
+    
+    def extract_key_terms_batch(self, texts: List[str], top_n: int = 20) -> List[List[Tuple[str, int]]]:
+        """
+        Extract key terms from many texts in one batched pass
         
-        # Count frequencies
-        from collections import Counter
-        term_freq = Counter(terms)
+        Returns:
+            List of (term, frequency) lists in the same order as texts
+        """
+        docs = self.nlp.pipe(texts, batch_size=PIPE_BATCH_SIZE, disable=TAGGING_DISABLE)
+        return [self._key_terms_from_doc(doc, top_n) for doc in docs]
+    
+    def _key_terms_from_doc(self, doc, top_n: int) -> List[Tuple[str, int]]:
+        """Count the most frequent content-word lemmas in a processed doc"""
+        # Count meaningful terms (nouns, proper nouns, adjectives) by lemma id
+        lemma_counts = _count_term_ids(doc.to_array(_TERM_ATTRS))
+        
+        # Resolve ids to strings and merge case variants
+        term_freq = Counter()
+        for lemma_id, count in lemma_counts.items():
+            term_freq[doc.vocab.strings[int(lemma_id)].lower()] += count
         
         return term_freq.most_common(top_n)
     
@@ -268,23 +714,6 @@ class NLPProcessor:
         """
         sections = {}
         
-        # Common section headers in contracts
-        section_headers = [
-            "DEFINITIONS",
-            "PARTIES",
-            "RECITALS",
-            "TERMS AND CONDITIONS",
-            "PAYMENT",
-            "TERMINATION",
-            "CONFIDENTIALITY",
-            "INTELLECTUAL PROPERTY",
-            "LIABILITY",
-            "INDEMNITY",
-            "DISPUTE RESOLUTION",
-            "GENERAL PROVISIONS",
-            "SIGNATURES"
-        ]
-        
         # Try to split by section headers
         current_section = "Preamble"
         current_content = []
@@ -292,23 +721,18 @@ class NLPProcessor:
         lines = text.split('\n')
         
         for line in lines:
-            line_upper = line.strip().upper()
+            stripped = line.strip()
             
             # Check if line is a section header
-            is_header = False
-            for header in section_headers:
-                if header in line_upper and len(line.strip()) < 100:
-                    # Save previous section
-                    if current_content:
-                        sections[current_section] = '\n'.join(current_content)
-                    
-                    # Start new section
-                    current_section = line.strip()
-                    current_content = []
-                    is_header = True
-                    break
-            
-            if not is_header:
+            if len(stripped) < 100 and _SECTION_HEADER_PATTERN.search(stripped.upper()):
+                # Save previous section
+                if current_content:
+                    sections[current_section] = '\n'.join(current_content)
+                
+                # Start new section
+                current_section = stripped
+                current_content = []
+            else:
                 current_content.append(line)
         
         # Save last section
@@ -2,31 +2,61 @@
 Report Generator Module
 Generates PDF reports for contract analysis
 """
-from typing import Dict, List
+from typing import Dict, Iterator
 from datetime import datetime
+import functools
+import heapq
+import itertools
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-import json
+import orjson
 import os
 from pathlib import Path
 
 
+# Audit logs live outside the report directory
+AUDIT_LOG_DIR = Path("data/audit_logs")
+
+
+def _json_default(obj):
+    """Serialize NamedTuple records (e.g. RiskItem) as JSON objects"""
+    if hasattr(obj, "_asdict"):
+        return obj._asdict()
+    raise TypeError
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process; later calls skip the filesystem"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 class ReportGenerator:
     """Generate PDF reports for contract analysis"""
     
     def __init__(self, output_dir: str = None):
         """Initialize report generator"""
         self.output_dir = Path(output_dir) if output_dir else Path("data/reports")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.output_dir.resolve())
         
         # Initialize styles
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
     
+    def _paragraph(self, text: str, style_name: str) -> Paragraph:
+        """
+        Create a paragraph with a named style, falling back to Normal
+        
+        Always a new flowable: reportlab mutates paragraphs during layout, so
+        they must not be shared between positions, builds, or sessions.
+        """
+        return Paragraph(text, self.styles.get(style_name, self.styles['Normal']))
+    
     def _setup_custom_styles(self):
         """Setup custom paragraph styles"""
         # Title style
@@ -76,20 +106,23 @@ class ReportGenerator:
             spaceAfter=6
         ))
     
-    def generate_full_report(self, analysis_results: Dict, output_filename: str = None) -> str:
+    def generate_full_report(self, analysis_results: Dict, output_filename: str = None,
+                             timestamp: datetime = None) -> str:
         """
         Generate comprehensive PDF report
         
         Args:
             analysis_results: Complete analysis results dictionary
             output_filename: Optional custom filename
+            timestamp: Optional precomputed time for the default filename,
+                e.g. one value shared across a batch of reports
             
         Returns:
             Path to generated PDF
         """
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"contract_analysis_{timestamp}.pdf"
+            timestamp = timestamp or datetime.now()
+            output_filename = f"contract_analysis_{timestamp:%Y%m%d_%H%M%S}.pdf"
         
         output_path = self.output_dir / output_filename
         
@@ -104,82 +137,65 @@ class ReportGenerator:
         )
         
         # Build content
-        story = []
-        
-        # Title page
-        story.extend(self._create_title_page(analysis_results))
-        story.append(PageBreak())
-        
-        # Executive Summary
-        story.extend(self._create_executive_summary(analysis_results))
-        story.append(PageBreak())
-        
-        # Risk Assessment
-        story.extend(self._create_risk_section(analysis_results))
-        story.append(PageBreak())
-        
-        # Entity Information
-        story.extend(self._create_entity_section(analysis_results))
-        
-        # Clause Analysis
-        story.extend(self._create_clause_section(analysis_results))
-        story.append(PageBreak())
-        
-        # Recommendations
-        story.extend(self._create_recommendations_section(analysis_results))
+        story = list(itertools.chain(
+            self._create_title_page(analysis_results),
+            [PageBreak()],
+            self._create_executive_summary(analysis_results),
+            [PageBreak()],
+            self._create_risk_section(analysis_results),
+            [PageBreak()],
+            self._create_entity_section(analysis_results),
+            self._create_clause_section(analysis_results),
+            [PageBreak()],
+            self._create_recommendations_section(analysis_results),
+        ))
         
         # Build PDF
         doc.build(story)
         
         return str(output_path)
     
-    def _create_title_page(self, results: Dict) -> List:
+    def _create_title_page(self, results: Dict) -> Iterator:
         """Create title page"""
-        elements = []
-        
         # Title
-        elements.append(Spacer(1, 2*inch))
-        elements.append(Paragraph("Contract Analysis Report", self.styles['CustomTitle']))
-        elements.append(Spacer(1, 0.5*inch))
+        yield Spacer(1, 2*inch)
+        yield self._paragraph("Contract Analysis Report", 'CustomTitle')
+        yield Spacer(1, 0.5*inch)
         
         # Contract info
         contract_type = results.get('contract_classification', {}).get('contract_type', 'Unknown')
-        elements.append(Paragraph(f"<b>Contract Type:</b> {contract_type}", self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph(f"<b>Contract Type:</b> {contract_type}", 'Normal')
+        yield Spacer(1, 0.2*inch)
         
         # Date
         report_date = datetime.now().strftime("%B %d, %Y")
-        elements.append(Paragraph(f"<b>Report Generated:</b> {report_date}", self.styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph(f"<b>Report Generated:</b> {report_date}", 'Normal')
+        yield Spacer(1, 0.2*inch)
         
         # Risk level
         risk_level = results.get('risk_assessment', {}).get('overall_level', 'Unknown')
         risk_color = {'HIGH': 'red', 'MEDIUM': 'orange', 'LOW': 'green'}.get(risk_level, 'black')
-        elements.append(Paragraph(
+        yield self._paragraph(
             f"<b>Overall Risk Level:</b> <font color='{risk_color}'>{risk_level}</font>",
-            self.styles['Normal']
-        ))
+            'Normal'
+        )
         
-        elements.append(Spacer(1, 1*inch))
-        elements.append(Paragraph(
+        yield Spacer(1, 1*inch)
+        yield self._paragraph(
             "<i>This report is generated by Legal Assistant AI for informational purposes. "
             "Please consult with a qualified legal professional for legal advice.</i>",
-            self.styles['Normal']
-        ))
-        
-        return elements
+            'Normal'
+        )
     
-    def _create_executive_summary(self, results: Dict) -> List:
+    def _create_executive_summary(self, results: Dict) -> Iterator:
         """Create executive summary section"""
-        elements = []
-        
-        elements.append(Paragraph("Executive Summary", self.styles['CustomHeading']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph("Executive Summary", 'CustomHeading')
+        yield Spacer(1, 0.2*inch)
         
         # Contract summary
         summary = results.get('llm_summary', 'No summary available.')
-        elements.append(Paragraph(summary, self.styles['Normal']))
-        elements.append(Spacer(1, 0.3*inch))
+        yield self._paragraph(summary, 'Normal')
+        yield Spacer(1, 0.3*inch)
         
         # Key statistics table
         risk_assessment = results.get('risk_assessment', {})
@@ -204,169 +220,155 @@ class ReportGenerator:
             ('GRID', (0, 0), (-1, -1), 1, colors.black)
         ]))
         
-        elements.append(table)
-        
-        return elements
+        yield table
     
-    def _create_risk_section(self, results: Dict) -> List:
+    def _create_risk_section(self, results: Dict) -> Iterator:
         """Create risk assessment section"""
-        elements = []
-        
-        elements.append(Paragraph("Risk Assessment", self.styles['CustomHeading']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph("Risk Assessment", 'CustomHeading')
+        yield Spacer(1, 0.2*inch)
         
         risk_assessment = results.get('risk_assessment', {})
         
         # Overall assessment
-        elements.append(Paragraph("<b>Overall Assessment</b>", self.styles['Heading3']))
-        elements.append(Paragraph(
+        yield self._paragraph("<b>Overall Assessment</b>", 'Heading3')
+        yield self._paragraph(
             risk_assessment.get('recommendation', 'No recommendation available.'),
-            self.styles['Normal']
-        ))
-        elements.append(Spacer(1, 0.2*inch))
+            'Normal'
+        )
+        yield Spacer(1, 0.2*inch)
         
         # High priority risks
         high_priority = risk_assessment.get('high_priority_risks', [])
         if high_priority:
-            elements.append(Paragraph("<b>High Priority Risks</b>", self.styles['Heading3']))
+            yield self._paragraph("<b>High Priority Risks</b>", 'Heading3')
             
             for i, risk in enumerate(high_priority[:10], 1):  # Limit to top 10
                 risk_text = f"{i}. <b>{risk.get('risk_type', 'Unknown')}</b> (Clause: {risk.get('clause_id', 'N/A')})"
-                elements.append(Paragraph(risk_text, self.styles['RiskHigh']))
+                yield self._paragraph(risk_text, 'RiskHigh')
                 
                 if risk.get('description'):
-                    elements.append(Paragraph(f"   {risk['description']}", self.styles['Normal']))
+                    yield self._paragraph(f"   {risk['description']}", 'Normal')
                 
-                elements.append(Spacer(1, 0.1*inch))
+                yield Spacer(1, 0.1*inch)
         
         # Risk mitigation strategies
         mitigation = results.get('mitigation_strategies', [])
         if mitigation:
-            elements.append(Spacer(1, 0.3*inch))
-            elements.append(Paragraph("<b>Risk Mitigation Strategies</b>", self.styles['Heading3']))
+            yield Spacer(1, 0.3*inch)
+            yield self._paragraph("<b>Risk Mitigation Strategies</b>", 'Heading3')
             
             for strategy in mitigation[:5]:  # Top 5 strategies
-                elements.append(Paragraph(
+                yield self._paragraph(
                     f"<b>{strategy.get('risk_category', 'Category')}</b>",
-                    self.styles['Normal']
-                ))
-                elements.append(Paragraph(
+                    'Normal'
+                )
+                yield self._paragraph(
                     f"Strategy: {strategy.get('strategy', '')}",
-                    self.styles['Normal']
-                ))
-                elements.append(Spacer(1, 0.1*inch))
-        
-        return elements
+                    'Normal'
+                )
+                yield Spacer(1, 0.1*inch)
     
-    def _create_entity_section(self, results: Dict) -> List:
+    def _create_entity_section(self, results: Dict) -> Iterator:
         """Create entity information section"""
-        elements = []
-        
-        elements.append(Paragraph("Key Information Extracted", self.styles['CustomHeading']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph("Key Information Extracted", 'CustomHeading')
+        yield Spacer(1, 0.2*inch)
         
         entities = results.get('entities', {})
         
         # Parties
         parties = entities.get('parties', [])
         if parties:
-            elements.append(Paragraph("<b>Parties Involved</b>", self.styles['Heading3']))
+            yield self._paragraph("<b>Parties Involved</b>", 'Heading3')
             for party in parties[:5]:  # Limit to 5
-                elements.append(Paragraph(
+                yield self._paragraph(
                     f"• {party.get('name', 'Unknown')} ({party.get('role', 'Role')})",
-                    self.styles['Normal']
-                ))
-            elements.append(Spacer(1, 0.2*inch))
+                    'Normal'
+                )
+            yield Spacer(1, 0.2*inch)
         
         # Amounts
         amounts = entities.get('amounts', [])
         if amounts:
-            elements.append(Paragraph("<b>Financial Terms</b>", self.styles['Heading3']))
+            yield self._paragraph("<b>Financial Terms</b>", 'Heading3')
             for amount in amounts[:5]:
-                elements.append(Paragraph(
+                yield self._paragraph(
                     f"• {amount.get('amount', 'Amount')}",
-                    self.styles['Normal']
-                ))
-            elements.append(Spacer(1, 0.2*inch))
+                    'Normal'
+                )
+            yield Spacer(1, 0.2*inch)
         
         # Dates
         dates = entities.get('dates', [])
         if dates:
-            elements.append(Paragraph("<b>Important Dates</b>", self.styles['Heading3']))
+            yield self._paragraph("<b>Important Dates</b>", 'Heading3')
             for date in dates[:5]:
-                elements.append(Paragraph(
+                yield self._paragraph(
                     f"• {date.get('date', 'Date')}",
-                    self.styles['Normal']
-                ))
-            elements.append(Spacer(1, 0.2*inch))
-        
-        return elements
+                    'Normal'
+                )
+            yield Spacer(1, 0.2*inch)
     
-    def _create_clause_section(self, results: Dict) -> List:
+    def _create_clause_section(self, results: Dict) -> Iterator:
         """Create clause analysis section"""
-        elements = []
-        
-        elements.append(Paragraph("Clause-by-Clause Analysis", self.styles['CustomHeading']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph("Clause-by-Clause Analysis", 'CustomHeading')
+        yield Spacer(1, 0.2*inch)
         
         clause_analysis = results.get('clause_analysis', [])
         
-        # Show top risky clauses
-        risky_clauses = [c for c in clause_analysis if c.get('risks')]
-        risky_clauses.sort(key=lambda x: len(x.get('risks', [])), reverse=True)
+        # Show top 10 risky clauses (same order as a stable descending sort)
+        risky_clauses = heapq.nlargest(
+            10,
+            (c for c in clause_analysis if c.get('risks')),
+            key=lambda x: len(x['risks'])
+        )
         
-        for clause in risky_clauses[:10]:  # Top 10 risky clauses
+        for clause in risky_clauses:
             clause_id = clause.get('clause_id', 'Unknown')
             clause_type = clause.get('clause_type', 'Unknown')
             
-            elements.append(Paragraph(
+            yield self._paragraph(
                 f"<b>Clause {clause_id}: {clause_type}</b>",
-                self.styles['Heading4']
-            ))
+                'Heading4'
+            )
             
             # Show risks
             for risk in clause.get('risks', []):
                 severity = risk.get('severity', 'MEDIUM')
                 style = f'Risk{severity.title()}' if severity in ['HIGH', 'MEDIUM', 'LOW'] else 'Normal'
                 
-                elements.append(Paragraph(
+                yield self._paragraph(
                     f"• [{severity}] {risk.get('risk_type', 'Unknown Risk')}",
-                    self.styles.get(style, self.styles['Normal'])
-                ))
+                    style
+                )
             
-            elements.append(Spacer(1, 0.2*inch))
-        
-        return elements
+            yield Spacer(1, 0.2*inch)
     
-    def _create_recommendations_section(self, results: Dict) -> List:
+    def _create_recommendations_section(self, results: Dict) -> Iterator:
         """Create recommendations section"""
-        elements = []
-        
-        elements.append(Paragraph("Recommendations", self.styles['CustomHeading']))
-        elements.append(Spacer(1, 0.2*inch))
+        yield self._paragraph("Recommendations", 'CustomHeading')
+        yield Spacer(1, 0.2*inch)
         
         # Negotiation points
         negotiation_points = results.get('negotiation_points', [])
         if negotiation_points:
-            elements.append(Paragraph("<b>Negotiation Points</b>", self.styles['Heading3']))
+            yield self._paragraph("<b>Negotiation Points</b>", 'Heading3')
             
             for point in negotiation_points:
-                elements.append(Paragraph(f"• {point}", self.styles['Normal']))
-                elements.append(Spacer(1, 0.1*inch))
+                yield self._paragraph(f"• {point}", 'Normal')
+                yield Spacer(1, 0.1*inch)
         
         # Compliance notes
-        elements.append(Spacer(1, 0.3*inch))
-        elements.append(Paragraph("<b>Compliance Notes</b>", self.styles['Heading3']))
-        elements.append(Paragraph(
+        yield Spacer(1, 0.3*inch)
+        yield self._paragraph("<b>Compliance Notes</b>", 'Heading3')
+        yield self._paragraph(
             "This contract should be reviewed for compliance with applicable Indian laws including "
             "the Indian Contract Act, 1872, and other relevant legislation. Consult with a legal "
             "professional for specific compliance requirements.",
-            self.styles['Normal']
-        ))
-        
-        return elements
+            'Normal'
+        )
     
-    def generate_summary_report(self, analysis_results: Dict, output_filename: str = None) -> str:
+    def generate_summary_report(self, analysis_results: Dict, output_filename: str = None,
+                                timestamp: datetime = None) -> str:
         """
         Generate a shorter summary report
         
@@ -374,8 +376,8 @@ class ReportGenerator:
             Path to generated PDF
         """
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"contract_summary_{timestamp}.pdf"
+            timestamp = timestamp or datetime.now()
+            output_filename = f"contract_summary_{timestamp:%Y%m%d_%H%M%S}.pdf"
         
         output_path = self.output_dir / output_filename
         
@@ -383,7 +385,7 @@ class ReportGenerator:
         story = []
         
         # Title
-        story.append(Paragraph("Contract Analysis Summary", self.styles['CustomTitle']))
+        story.append(self._paragraph("Contract Analysis Summary", 'CustomTitle'))
         story.append(Spacer(1, 0.3*inch))
         
         # Executive summary
@@ -397,7 +399,8 @@ class ReportGenerator:
         
         return str(output_path)
     
-    def export_to_json(self, analysis_results: Dict, output_filename: str = None) -> str:
+    def export_to_json(self, analysis_results: Dict, output_filename: str = None,
+                       timestamp: datetime = None) -> str:
         """
         Export analysis results to JSON
         
@@ -405,29 +408,34 @@ class ReportGenerator:
             Path to JSON file
         """
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"contract_analysis_{timestamp}.json"
+            timestamp = timestamp or datetime.now()
+            output_filename = f"contract_analysis_{timestamp:%Y%m%d_%H%M%S}.json"
         
         output_path = self.output_dir / output_filename
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(
+            orjson.dumps(
+                analysis_results,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        )
         
         return str(output_path)
     
-    def create_audit_log(self, analysis_results: Dict, user_info: Dict = None) -> str:
+    def create_audit_log(self, analysis_results: Dict, user_info: Dict = None,
+                         timestamp: datetime = None) -> str:
         """
         Create audit log entry
         
         Returns:
             Path to audit log file
         """
-        timestamp = datetime.now().isoformat()
-        audit_dir = Path("data/audit_logs")
-        audit_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = timestamp or datetime.now()
+        audit_dir = _ensure_dir(AUDIT_LOG_DIR)
         
         audit_entry = {
-            "timestamp": timestamp,
+            "timestamp": timestamp.isoformat(),
             "contract_type": analysis_results.get('contract_classification', {}).get('contract_type'),
             "risk_level": analysis_results.get('risk_assessment', {}).get('overall_level'),
             "user_info": user_info or {},
@@ -438,17 +446,23 @@ class ReportGenerator:
             }
         }
         
-        # Append to audit log
-        audit_file = audit_dir / f"audit_log_{datetime.now().strftime('%Y%m')}.json"
-        
-        logs = []
-        if audit_file.exists():
-            with open(audit_file, 'r') as f:
-                logs = json.load(f)
+        # Append one JSON line to this month's audit log (a single small
+        # O_APPEND write, so concurrent writers do not interleave lines)
+        audit_file = audit_dir / f"audit_log_{timestamp:%Y%m}.jsonl"
         
-        logs.append(audit_entry)
-        
-        with open(audit_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        with open(audit_file, 'ab') as f:
+            f.write(orjson.dumps(audit_entry) + b"\n")
         
         return str(audit_file)
+    
+    def read_audit_log(self, audit_file: str) -> Iterator[Dict]:
+        """
+        Stream entries from a JSONL audit log
+        
+        Returns:
+            Iterator of audit entry dictionaries
+        """
+        with open(audit_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
@@ -2,9 +2,201 @@
 Risk Assessor Module
 Calculates risk scores for contracts
 """
-from typing import Dict, List
+import bisect
+import heapq
+import itertools
+import re
+import sys
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Tuple
+import numpy as np
 from config import RISK_LEVELS, RISK_CATEGORIES
 
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+# Keywords for categorizing LLM-reported risk types, in priority order
+LLM_RISK_KEYWORDS = {
+    "payment_terms": r'payment|fee',
+    "unilateral_termination": r'terminat',
+    "indemnity": r'indemnity|indemnif',
+    "liability": r'liability|liable',
+    "penalty_clauses": r'penalt',
+    "non_compete": r'compete',
+    "auto_renewal": r'renew',
+    "arbitration": r'arbitration|jurisdiction',
+    "confidentiality": r'confidential',
+}
+
+# One named group per category inside a lookahead, so every position where a
+# keyword starts is reported even when keywords overlap. The group number is
+# the category's priority.
+_LLM_RISK_PATTERN = re.compile(
+    r'(?=' + "|".join(
+        f"(?P<{category}>{keywords})" for category, keywords in LLM_RISK_KEYWORDS.items()
+    ) + r')',
+    re.IGNORECASE
+)
+
+# Breakdown categories in report order; "other" collects uncategorized risks
+_ALL_CATEGORIES = (*RISK_CATEGORIES, "other")
+
+# Categories whose HIGH risks are flagged as critical, in reporting order
+_PRIORITY_CATEGORIES = (
+    "unilateral_termination",
+    "indemnity",
+    "liability",
+    "non_compete",
+    "penalty_clauses"
+)
+
+# Category name -> small integer id used to index weight tables
+_CATEGORY_ID = {category: i for i, category in enumerate(_ALL_CATEGORIES)}
+_OTHER_ID = _CATEGORY_ID["other"]
+
+# Display label for each category id
+_CATEGORY_LABELS = tuple(RISK_CATEGORIES.get(category, category) for category in _ALL_CATEGORIES)
+
+# Severity levels frozen at import: level -> index, and score by index. An
+# unrecognized severity gets index _UNKNOWN_SEV and is scored as MEDIUM.
+# _SEV_SCORES is the only severity -> score table; _SEV_LUT is its array form.
+_SEV_INDEX = {level: i for i, level in enumerate(RISK_LEVELS)}
+_HIGH_IDX = _SEV_INDEX["HIGH"]
+_MEDIUM_IDX = _SEV_INDEX["MEDIUM"]
+_LOW_IDX = _SEV_INDEX["LOW"]
+_UNKNOWN_SEV = len(_SEV_INDEX)
+_SEV_SCORES = (*(info["score"] for info in RISK_LEVELS.values()), RISK_LEVELS["MEDIUM"]["score"])
+_SEV_LUT = np.array(_SEV_SCORES, dtype=np.float64)
+
+
+# Score thresholds (inclusive lower bounds) for MEDIUM and HIGH, on the
+# 0-100 contract scale and the 0-10 clause scale
+_LEVEL_NAMES = ("LOW", "MEDIUM", "HIGH")
+_LEVEL_THRESHOLDS = (40, 70)
+_CLAUSE_THRESHOLDS = (4, 7)
+
+# Overall recommendation text per risk level
+_RECOMMENDATIONS = {
+    "HIGH": (
+        "⚠️ HIGH RISK: This contract contains significant risks. "
+        "We strongly recommend consulting with a legal professional before signing. "
+        "Consider negotiating the high-risk clauses identified."
+    ),
+    "MEDIUM": (
+        "⚡ MEDIUM RISK: This contract has some concerning clauses. "
+        "Review the identified risks carefully and consider negotiating terms. "
+        "Legal consultation is recommended for complex issues."
+    ),
+    "LOW": (
+        "✅ LOW RISK: This contract appears relatively balanced. "
+        "Review the summary and specific clauses, but major concerns are minimal. "
+        "Standard business review should be sufficient."
+    ),
+}
+
+# Recommended action per risk category for critical risks
+_ACTIONS = {
+    "unilateral_termination": "Negotiate for mutual termination rights or require cause",
+    "indemnity": "Request liability cap and scope limitation",
+    "liability": "Add maximum liability cap",
+    "penalty_clauses": "Negotiate lower penalty amounts",
+    "non_compete": "Narrow geographic and time scope",
+    "auto_renewal": "Request opt-in renewal or longer notice",
+    "payment_terms": "Negotiate milestone-based payments"
+}
+
+
+def _intern(value):
+    """Intern strings so repeated severity/category probes hit the identity fast path"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _clause_totals_numpy(sev: np.ndarray, cat: np.ndarray, offsets: np.ndarray,
+                         sev_lut: np.ndarray, cat_lut: np.ndarray) -> np.ndarray:
+    """Sum severity score x weight per clause; clause c owns rows offsets[c]:offsets[c+1]"""
+    owner = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    return np.bincount(owner, weights=sev_lut[sev] * cat_lut[cat], minlength=len(offsets) - 1)
+
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _clause_totals_numba(sev, cat, offsets, sev_lut, cat_lut):
+        """Sum severity score x weight per clause, one compiled loop per clause in parallel"""
+        n = offsets.shape[0] - 1
+        totals = np.zeros(n)
+        for c in prange(n):
+            total = 0.0
+            for i in range(offsets[c], offsets[c + 1]):
+                total += sev_lut[sev[i]] * cat_lut[cat[i]]
+            totals[c] = total
+        return totals
+
+
+def _clause_totals(sev: np.ndarray, cat: np.ndarray, offsets: np.ndarray,
+                   sev_lut: np.ndarray, cat_lut: np.ndarray) -> np.ndarray:
+    """Per-clause raw risk totals, using the Numba kernel when available"""
+    if _NUMBA_AVAILABLE:
+        return _clause_totals_numba(sev, cat, offsets, sev_lut, cat_lut)
+    return _clause_totals_numpy(sev, cat, offsets, sev_lut, cat_lut)
+
+
+class RiskItem(NamedTuple):
+    """One scored risk in an assessment's risk_breakdown"""
+    clause_id: str
+    risk_type: str
+    severity: str
+    score: float
+    description: str
+    
+    def get(self, key: str, default=None):
+        """Dict-style field access, for callers written against dict entries"""
+        return getattr(self, key) if key in self._fields else default
+
+
+@dataclass(slots=True)
+class _RiskTable:
+    """
+    Every risk of one assessment as parallel columns (structure of arrays)
+    
+    category and severity hold indexes into _ALL_CATEGORIES and RISK_LEVELS;
+    an unrecognized severity is stored as _UNKNOWN_SEV. Rows are in
+    detection order, not grouped by category.
+    """
+    category: np.ndarray
+    severity: np.ndarray
+    score: np.ndarray
+    clause_id: List[str]
+    risk_type: List[str]
+    severity_label: List[str]
+    description: List[str]
+    
+    def __len__(self) -> int:
+        return len(self.score)
+    
+    def category_order(self) -> np.ndarray:
+        """Row indexes grouped by category, keeping detection order within each"""
+        return np.argsort(self.category, kind="stable")
+    
+    def to_breakdown(self) -> Dict[str, List[RiskItem]]:
+        """Materialize the public category -> list of RiskItem view"""
+        breakdown = {category: [] for category in _ALL_CATEGORIES}
+        categories = self.category.tolist()
+        scores = self.score.tolist()
+        for i in self.category_order().tolist():
+            breakdown[_ALL_CATEGORIES[categories[i]]].append(RiskItem(
+                self.clause_id[i],
+                self.risk_type[i],
+                self.severity_label[i],
+                scores[i],
+                self.description[i]
+            ))
+        return breakdown
+
 
 class RiskAssessor:
     """Assess and score contract risks"""
@@ -22,6 +214,13 @@ class RiskAssessor:
             "liability": 1.6,
             "confidentiality": 0.8
         }
+        
+        # Category weight lookup table for vectorized scoring
+        self._cat_lut = np.array(
+            [self.risk_weights.get(category, 1.0) for category in _ALL_CATEGORIES],
+            dtype=np.float64
+        )
+        self._cat_weights = tuple(self._cat_lut.tolist())
     
     def assess_contract_risk(self, analyzed_clauses: List[Dict], llm_risks: List[Dict] = None) -> Dict:
         """
@@ -34,59 +233,13 @@ class RiskAssessor:
         Returns:
             Dict with risk scores and breakdown
         """
-        # Initialize risk tracking
-        risk_breakdown = {category: [] for category in RISK_CATEGORIES.keys()}
-        risk_breakdown["other"] = []
-        
-        total_risk_score = 0
         clause_count = len(analyzed_clauses)
         
-        # Process NLP-detected risks
-        for clause in analyzed_clauses:
-            clause_risks = clause.get("risks", [])
-            
-            for risk in clause_risks:
-                category = risk.get("category", "other")
-                severity = risk.get("severity", "MEDIUM")
-                
-                # Calculate risk score
-                severity_score = RISK_LEVELS[severity]["score"]
-                weight = self.risk_weights.get(category, 1.0)
-                risk_score = severity_score * weight
-                
-                total_risk_score += risk_score
-                
-                # Add to breakdown
-                risk_breakdown[category].append({
-                    "clause_id": clause.get("clause_id", "Unknown"),
-                    "risk_type": risk.get("risk_type", "Unknown Risk"),
-                    "severity": severity,
-                    "score": risk_score,
-                    "description": risk.get("description", "")
-                })
-        
-        # Process LLM-detected risks
-        if llm_risks:
-            for risk in llm_risks:
-                severity = risk.get("severity", "MEDIUM")
-                risk_type = risk.get("type", "General Risk")
-                
-                # Try to categorize
-                category = self._categorize_llm_risk(risk_type)
-                
-                severity_score = RISK_LEVELS.get(severity, RISK_LEVELS["MEDIUM"])["score"]
-                weight = self.risk_weights.get(category, 1.0)
-                risk_score = severity_score * weight
-                
-                total_risk_score += risk_score
-                
-                risk_breakdown[category].append({
-                    "clause_id": "LLM Analysis",
-                    "risk_type": risk_type,
-                    "severity": severity,
-                    "score": risk_score,
-                    "description": risk.get("description", "")
-                })
+        # Every risk as parallel columns
+        table = self._build_risk_table(analyzed_clauses, llm_risks)
+        # Added in clause order, as the per-risk loop did: numpy's pairwise
+        # summation rounds differently and can move a score across a threshold
+        total_risk_score = sum(table.score.tolist())
         
         # Calculate normalized score (0-100)
         if clause_count > 0:
@@ -99,25 +252,155 @@ class RiskAssessor:
         overall_risk_level = self._determine_risk_level(normalized_score)
         
         # Generate risk summary
-        risk_summary = self._generate_risk_summary(risk_breakdown, overall_risk_level)
+        risk_summary = self._generate_risk_summary(table, overall_risk_level)
         
         return {
             "overall_score": round(normalized_score, 2),
             "overall_level": overall_risk_level,
-            "total_risks_found": sum(len(risks) for risks in risk_breakdown.values()),
-            "risk_breakdown": risk_breakdown,
+            "total_risks_found": len(table),
+            "risk_breakdown": table.to_breakdown(),
             "risk_summary": risk_summary,
-            "high_priority_risks": self._get_high_priority_risks(risk_breakdown),
+            "high_priority_risks": self._get_high_priority_risks(table),
+            "has_high_severity": self._get_high_severity_categories(table),
             "recommendation": self._get_recommendation(overall_risk_level, normalized_score)
         }
     
-    def calculate_clause_risk_score(self, clause: Dict) -> Dict:
+    def _build_risk_table(self, analyzed_clauses: List[Dict], llm_risks: List[Dict] = None) -> _RiskTable:
+        """Flatten NLP and LLM risks into a _RiskTable, scoring them in one vectorized pass"""
+        sev_ids = []
+        cat_ids = []
+        clause_ids = []
+        risk_types = []
+        severities = []
+        descriptions = []
+        
+        # Collect NLP-detected risks
+        for clause in analyzed_clauses:
+            clause_risks = clause.get("risks", [])
+            clause_id = clause.get("clause_id", "Unknown")
+            
+            for risk in clause_risks:
+                category = _intern(risk.get("category", "other"))
+                severity = _intern(risk.get("severity", "MEDIUM"))
+                
+                sev_ids.append(_SEV_INDEX[severity])
+                cat_ids.append(_CATEGORY_ID[category])
+                clause_ids.append(clause_id)
+                risk_types.append(risk.get("risk_type", "Unknown Risk"))
+                severities.append(severity)
+                descriptions.append(risk.get("description", ""))
+        
+        # Collect LLM-detected risks
+        if llm_risks:
+            llm_types = [risk.get("type", "General Risk") for risk in llm_risks]
+            
+            # Categorize all LLM risks in one regex scan
+            llm_categories = self._categorize_llm_risks(llm_types)
+            
+            for risk, risk_type, category in zip(llm_risks, llm_types, llm_categories):
+                severity = _intern(risk.get("severity", "MEDIUM"))
+                
+                sev_ids.append(_SEV_INDEX.get(severity, _UNKNOWN_SEV))
+                cat_ids.append(_CATEGORY_ID[category])
+                clause_ids.append("LLM Analysis")
+                risk_types.append(risk_type)
+                severities.append(severity)
+                descriptions.append(risk.get("description", ""))
+        
+        sev_arr = np.array(sev_ids, dtype=np.intp)
+        cat_arr = np.array(cat_ids, dtype=np.intp)
+        
+        # Score = severity score x category weight, for all risks at once
+        return _RiskTable(
+            category=cat_arr,
+            severity=sev_arr,
+            score=_SEV_LUT[sev_arr] * self._cat_lut[cat_arr],
+            clause_id=clause_ids,
+            risk_type=risk_types,
+            severity_label=severities,
+            description=descriptions
+        )
+    
+    def calculate_clause_risk_score(self, clause: Dict,
+                                    encoded: Tuple[np.ndarray, np.ndarray] = None) -> Dict:
         """
         Calculate risk score for a single clause
         
+        Args:
+            clause: Analyzed clause from ClauseAnalyzer
+            encoded: Optional (severity ids, category ids) from _encode_clause_risks,
+                when the caller has already encoded this clause's risks
+        
         Returns:
             Dict with clause risk assessment
         """
+        if encoded is None:
+            total = self._score_risks(clause.get("risks", []))
+        else:
+            total = self._score_from_encoded(*encoded)
+        
+        return self._clause_risk_result(clause, total)
+    
+    def _score_risks(self, risks: List[Dict]) -> float:
+        """
+        Raw (unnormalized) risk total for one clause, straight from its risk dicts
+        
+        A plain loop: a clause has a handful of risks, far too few to repay
+        encoding, array setup, or a kernel launch (those serve the batch path).
+        """
+        sev_scores = _SEV_SCORES
+        weights = self.risk_weights
+        total = 0.0
+        for risk in risks:
+            total += (sev_scores[_SEV_INDEX[risk.get("severity", "MEDIUM")]]
+                      * weights.get(risk.get("category", "other"), 1.0))
+        return total
+    
+    def _encode_clause_risks(self, risks: List[Dict]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Encode a clause's risks as severity and category id tuples"""
+        sev_ids = tuple(_SEV_INDEX[_intern(risk.get("severity", "MEDIUM"))] for risk in risks)
+        cat_ids = tuple(_CATEGORY_ID.get(_intern(risk.get("category", "other")), _OTHER_ID) for risk in risks)
+        return sev_ids, cat_ids
+    
+    def _score_from_encoded(self, sev, cat) -> float:
+        """Raw (unnormalized) risk total for one clause's encoded risks"""
+        sev_scores = _SEV_SCORES
+        cat_weights = self._cat_weights
+        total = 0.0
+        for s, c in zip(sev, cat):
+            total += sev_scores[s] * cat_weights[c]
+        return total
+    
+    def calculate_clause_risk_scores_batch(self, clauses: List[Dict]) -> List[Dict]:
+        """
+        Calculate risk scores for many clauses in one vectorized pass
+        
+        Returns:
+            List of clause risk assessments in the same order as clauses
+        """
+        sev_ids = []
+        cat_ids = []
+        offsets = [0]
+        
+        # Encode every risk of every clause into flat index arrays
+        for clause in clauses:
+            for risk in clause.get("risks", []):
+                sev_ids.append(_SEV_INDEX[_intern(risk.get("severity", "MEDIUM"))])
+                cat_ids.append(_CATEGORY_ID.get(_intern(risk.get("category", "other")), _OTHER_ID))
+            offsets.append(len(sev_ids))
+        
+        totals = _clause_totals(
+            np.array(sev_ids, dtype=np.intp),
+            np.array(cat_ids, dtype=np.intp),
+            np.array(offsets, dtype=np.intp),
+            _SEV_LUT,
+            self._cat_lut
+        ).tolist()
+        
+        return [self._clause_risk_result(clause, total) for clause, total in zip(clauses, totals)]
+    
+    def _clause_risk_result(self, clause: Dict, total_score: float) -> Dict:
+        """Build the risk assessment dict for one clause from its raw score total"""
         risks = clause.get("risks", [])
         
         if not risks:
@@ -128,25 +411,11 @@ class RiskAssessor:
                 "risk_count": 0
             }
         
-        total_score = 0
-        for risk in risks:
-            severity = risk.get("severity", "MEDIUM")
-            category = risk.get("category", "other")
-            
-            severity_score = RISK_LEVELS[severity]["score"]
-            weight = self.risk_weights.get(category, 1.0)
-            total_score += severity_score * weight
-        
         # Normalize to 0-10 scale
         normalized_score = min(10, total_score)
         
         # Determine level
-        if normalized_score >= 7:
-            level = "HIGH"
-        elif normalized_score >= 4:
-            level = "MEDIUM"
-        else:
-            level = "LOW"
+        level = _LEVEL_NAMES[bisect.bisect_right(_CLAUSE_THRESHOLDS, normalized_score)]
         
         return {
             "clause_id": clause.get("clause_id", "Unknown"),
@@ -167,16 +436,7 @@ class RiskAssessor:
         
         risk_breakdown = risk_assessment.get("risk_breakdown", {})
         
-        # Priority categories
-        priority_categories = [
-            "unilateral_termination",
-            "indemnity",
-            "liability",
-            "non_compete",
-            "penalty_clauses"
-        ]
-        
-        for category in priority_categories:
+        for category in _PRIORITY_CATEGORIES:
             category_risks = risk_breakdown.get(category, [])
             
             # Get HIGH severity risks
@@ -203,6 +463,10 @@ class RiskAssessor:
         
         risk_breakdown = risk_assessment.get("risk_breakdown", {})
         
+        # Clean contract: stop at the first non-empty category check
+        if not any(risk_breakdown.values()):
+            return strategies
+        
         strategy_templates = {
             "unilateral_termination": {
                 "strategy": "Negotiate for mutual termination rights or require specific cause",
@@ -254,15 +518,22 @@ class RiskAssessor:
             }
         }
         
+        # Per-category HIGH flags computed during assessment, when present
+        has_high = risk_assessment.get("has_high_severity")
+        
         for category, risks in risk_breakdown.items():
             if risks and category in strategy_templates:
                 template = strategy_templates[category]
+                if has_high is not None:
+                    high = has_high.get(category, False)
+                else:
+                    high = any(r.get("severity") == "HIGH" for r in risks)
                 strategies.append({
                     "risk_category": RISK_CATEGORIES.get(category, category),
                     "affected_clauses": len(risks),
                     "strategy": template["strategy"],
                     "actions": template["actions"],
-                    "priority": "HIGH" if any(r.get("severity") == "HIGH" for r in risks) else "MEDIUM"
+                    "priority": "HIGH" if high else "MEDIUM"
                 })
         
         # Sort by priority
@@ -272,56 +543,51 @@ class RiskAssessor:
     
     def _categorize_llm_risk(self, risk_type: str) -> str:
         """Categorize LLM-identified risk"""
-        risk_type_lower = risk_type.lower()
-        
-        if "payment" in risk_type_lower or "fee" in risk_type_lower:
-            return "payment_terms"
-        elif "terminat" in risk_type_lower:
-            return "unilateral_termination"
-        elif "indemnity" in risk_type_lower or "indemnif" in risk_type_lower:
-            return "indemnity"
-        elif "liability" in risk_type_lower or "liable" in risk_type_lower:
-            return "liability"
-        elif "penalty" in risk_type_lower or "penalt" in risk_type_lower:
-            return "penalty_clauses"
-        elif "compete" in risk_type_lower or "non-compete" in risk_type_lower:
-            return "non_compete"
-        elif "renewal" in risk_type_lower or "renew" in risk_type_lower:
-            return "auto_renewal"
-        elif "arbitration" in risk_type_lower or "jurisdiction" in risk_type_lower:
-            return "arbitration"
-        elif "confidential" in risk_type_lower:
-            return "confidentiality"
-        else:
-            return "other"
+        return self._categorize_llm_risks([risk_type])[0]
+    
+    def _categorize_llm_risks(self, risk_types: List[str]) -> List[str]:
+        """Categorize many LLM-identified risks with one scan over their joined text"""
+        # NUL separators keep keywords from matching across two risk types
+        joined = "\x00".join(risk_types)
+        starts = [0, *itertools.accumulate(len(risk_type) + 1 for risk_type in risk_types[:-1])]
+        
+        # Lowest group number (highest priority) seen in each risk type
+        best = [None] * len(risk_types)
+        categories = ["other"] * len(risk_types)
+        for match in _LLM_RISK_PATTERN.finditer(joined):
+            i = bisect.bisect_right(starts, match.start()) - 1
+            if best[i] is None or match.lastindex < best[i]:
+                best[i] = match.lastindex
+                categories[i] = match.lastgroup
+        
+        return categories
     
     def _determine_risk_level(self, score: float) -> str:
         """Determine overall risk level from score"""
-        if score >= 70:
-            return "HIGH"
-        elif score >= 40:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return _LEVEL_NAMES[bisect.bisect_right(_LEVEL_THRESHOLDS, score)]
     
-    def _generate_risk_summary(self, risk_breakdown: Dict, overall_level: str) -> str:
+    def _generate_risk_summary(self, table: _RiskTable, overall_level: str) -> str:
         """Generate human-readable risk summary"""
-        total_risks = sum(len(risks) for risks in risk_breakdown.values())
-        
-        if total_risks == 0:
+        # Row count is O(1) on the table, so the clean-contract path builds no counters
+        if not len(table):
             return "No significant risks identified in this contract."
         
-        # Count by severity
-        high_count = sum(1 for risks in risk_breakdown.values() for r in risks if r.get("severity") == "HIGH")
-        medium_count = sum(1 for risks in risk_breakdown.values() for r in risks if r.get("severity") == "MEDIUM")
-        low_count = sum(1 for risks in risk_breakdown.values() for r in risks if r.get("severity") == "LOW")
+        total_risks = len(table)
+        
+        # Count by severity and by category, one C-level pass each
+        severity_counts = np.bincount(table.severity, minlength=_UNKNOWN_SEV + 1)
+        high_count = int(severity_counts[_HIGH_IDX])
+        medium_count = int(severity_counts[_MEDIUM_IDX])
+        low_count = int(severity_counts[_LOW_IDX])
+        
+        category_counts = np.bincount(table.category, minlength=len(_ALL_CATEGORIES)).tolist()
         
         # Find top risk categories
-        top_categories = sorted(
-            [(cat, len(risks)) for cat, risks in risk_breakdown.items() if risks],
-            key=lambda x: x[1],
-            reverse=True
-        )[:3]
+        top_categories = heapq.nlargest(
+            3,
+            [(cat, count) for cat, count in zip(_ALL_CATEGORIES, category_counts) if count],
+            key=itemgetter(1)
+        )
         
         summary = f"Overall Risk Level: {overall_level}\n\n"
         summary += f"Total Risks Identified: {total_risks}\n"
@@ -337,53 +603,34 @@ class RiskAssessor:
         
         return summary
     
-    def _get_high_priority_risks(self, risk_breakdown: Dict) -> List[Dict]:
+    def _get_high_priority_risks(self, table: _RiskTable) -> List[Dict]:
         """Extract high-priority risks"""
-        high_priority = []
-        
-        for category, risks in risk_breakdown.items():
-            for risk in risks:
-                if risk.get("severity") == "HIGH":
-                    high_priority.append({
-                        "category": RISK_CATEGORIES.get(category, category),
-                        "risk_type": risk.get("risk_type"),
-                        "clause_id": risk.get("clause_id"),
-                        "description": risk.get("description")
-                    })
-        
-        return high_priority
+        # Select HIGH rows first, then group only those by category
+        high_rows = np.flatnonzero(table.severity == _HIGH_IDX)
+        high_rows = high_rows[np.argsort(table.category[high_rows], kind="stable")]
+        categories = table.category[high_rows].tolist()
+        
+        return [
+            {
+                "category": _CATEGORY_LABELS[category],
+                "risk_type": table.risk_type[i],
+                "clause_id": table.clause_id[i],
+                "description": table.description[i]
+            }
+            for i, category in zip(high_rows.tolist(), categories)
+        ]
+    
+    def _get_high_severity_categories(self, table: _RiskTable) -> Dict[str, bool]:
+        """Flag each category that has at least one HIGH severity risk"""
+        high_counts = np.bincount(
+            table.category[table.severity == _HIGH_IDX], minlength=len(_ALL_CATEGORIES)
+        ).tolist()
+        return {category: count > 0 for category, count in zip(_ALL_CATEGORIES, high_counts)}
     
     def _get_recommendation(self, risk_level: str, score: float) -> str:
         """Get recommendation based on risk level"""
-        if risk_level == "HIGH":
-            return (
-                "⚠️ HIGH RISK: This contract contains significant risks. "
-                "We strongly recommend consulting with a legal professional before signing. "
-                "Consider negotiating the high-risk clauses identified."
-            )
-        elif risk_level == "MEDIUM":
-            return (
-                "⚡ MEDIUM RISK: This contract has some concerning clauses. "
-                "Review the identified risks carefully and consider negotiating terms. "
-                "Legal consultation is recommended for complex issues."
-            )
-        else:
-            return (
-                "✅ LOW RISK: This contract appears relatively balanced. "
-                "Review the summary and specific clauses, but major concerns are minimal. "
-                "Standard business review should be sufficient."
-            )
+        return _RECOMMENDATIONS.get(risk_level, _RECOMMENDATIONS["LOW"])
     
     def _get_action_for_risk(self, category: str, risk: Dict) -> str:
         """Get recommended action for specific risk"""
-        actions = {
-            "unilateral_termination": "Negotiate for mutual termination rights or require cause",
-            "indemnity": "Request liability cap and scope limitation",
-            "liability": "Add maximum liability cap",
-            "penalty_clauses": "Negotiate lower penalty amounts",
-            "non_compete": "Narrow geographic and time scope",
-            "auto_renewal": "Request opt-in renewal or longer notice",
-            "payment_terms": "Negotiate milestone-based payments"
-        }
-        
-        return actions.get(category, "Review and negotiate this clause")
+        return _ACTIONS.get(category, "Review and negotiate this clause")
@@ -2,170 +2,250 @@
 Template Generator Module
 Generates standardized contract templates for Indian SMEs
 """
-from typing import Dict, List, Optional
+from typing import Callable, ClassVar, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
+import functools
 import json
+import string
+from types import MappingProxyType
 
+# Shared read-only stand-in for "no fields", so empty renders allocate nothing
+_EMPTY: Mapping[str, str] = MappingProxyType({})
 
-class TemplateGenerator:
-    """Generate standard contract templates"""
-    
-    def __init__(self):
-        """Initialize template generator"""
-        self.templates = self._load_template_definitions()
-    
-    def _load_template_definitions(self) -> Dict:
-        """Load template definitions"""
-        # Define standard templates for Indian SMEs
-        return {
-            "employment_agreement": {
-                "name": "Employment Agreement",
-                "description": """Standard employment contract for hiring employees in India.
+
+# Standard templates for Indian SMEs
+_TEMPLATE_DEFINITIONS = {
+    "employment_agreement": {
+        "name": "Employment Agreement",
+        "description": """Standard employment contract for hiring employees in India.
 • Covers job role, salary, working hours, and benefits
 • Includes termination clause with notice period
 • Contains confidentiality and non-compete provisions
 • Compliant with Indian Contract Act, 1872 and Payment of Wages Act, 1936
 • Suitable for permanent, full-time employees""",
-                "sections": [
-                    "Parties", "Position and Duties", "Compensation", "Working Hours",
-                    "Benefits", "Leave Policy", "Termination", "Confidentiality",
-                    "Non-Compete", "Dispute Resolution"
-                ]
-            },
-            "vendor_contract": {
-                "name": "Vendor/Supplier Contract",
-                "description": """Agreement for goods or services procurement from vendors/suppliers.
+        "sections": (
+            "Parties", "Position and Duties", "Compensation", "Working Hours",
+            "Benefits", "Leave Policy", "Termination", "Confidentiality",
+            "Non-Compete", "Dispute Resolution"
+        )
+    },
+    "vendor_contract": {
+        "name": "Vendor/Supplier Contract",
+        "description": """Agreement for goods or services procurement from vendors/suppliers.
 • Defines scope of products/services to be supplied
 • Specifies pricing, payment terms, and delivery schedules
 • Includes quality standards and warranty provisions
 • Contains liability and indemnification clauses
 • Ideal for regular business-to-business purchases""",
-                "sections": [
-                    "Parties", "Scope of Work", "Pricing and Payment", "Delivery Terms",
-                    "Quality Standards", "Warranties", "Liability", "Termination",
-                    "Dispute Resolution"
-                ]
-            },
-            "service_contract": {
-                "name": "Service Agreement",
-                "description": """Professional services contract for consultants, freelancers, or agencies.
+        "sections": (
+            "Parties", "Scope of Work", "Pricing and Payment", "Delivery Terms",
+            "Quality Standards", "Warranties", "Liability", "Termination",
+            "Dispute Resolution"
+        )
+    },
+    "service_contract": {
+        "name": "Service Agreement",
+        "description": """Professional services contract for consultants, freelancers, or agencies.
 • Clearly defines services, deliverables, and timelines
 • Covers fee structure and payment milestones
 • Addresses intellectual property ownership
 • Includes confidentiality and non-disclosure terms
 • Perfect for IT services, consulting, marketing, etc.""",
-                "sections": [
-                    "Parties", "Services Description", "Deliverables", "Timeline",
-                    "Fees and Payment", "Intellectual Property", "Confidentiality",
-                    "Termination", "Liability", "Dispute Resolution"
-                ]
-            },
-            "lease_agreement": {
-                "name": "Commercial Lease Agreement",
-                "description": """Office/commercial space rental agreement for business premises.
+        "sections": (
+            "Parties", "Services Description", "Deliverables", "Timeline",
+            "Fees and Payment", "Intellectual Property", "Confidentiality",
+            "Termination", "Liability", "Dispute Resolution"
+        )
+    },
+    "lease_agreement": {
+        "name": "Commercial Lease Agreement",
+        "description": """Office/commercial space rental agreement for business premises.
 • Covers rent amount, deposit, and lease duration
 • Defines maintenance responsibilities and permitted use
 • Includes renewal and termination conditions
 • Addresses security deposit and rent escalation
 • Suitable for offices, shops, warehouses, etc.""",
-                "sections": [
-                    "Parties", "Property Description", "Lease Term", "Rent and Deposit",
-                    "Maintenance", "Use of Premises", "Termination", "Renewal",
-                    "Dispute Resolution"
-                ]
-            },
-            "partnership_deed": {
-                "name": "Partnership Deed",
-                "description": """Agreement for establishing a business partnership between two or more parties.
+        "sections": (
+            "Parties", "Property Description", "Lease Term", "Rent and Deposit",
+            "Maintenance", "Use of Premises", "Termination", "Renewal",
+            "Dispute Resolution"
+        )
+    },
+    "partnership_deed": {
+        "name": "Partnership Deed",
+        "description": """Agreement for establishing a business partnership between two or more parties.
 • Defines capital contribution from each partner
 • Specifies profit and loss sharing ratio
 • Covers roles, responsibilities, and decision-making authority
 • Includes provisions for admission/retirement of partners
 • Essential for LLPs and partnership firms""",
-                "sections": [
-                    "Partners", "Business Name and Nature", "Capital Contribution",
-                    "Profit Sharing", "Management", "Decision Making",
-                    "Addition/Removal of Partners", "Dissolution", "Dispute Resolution"
-                ]
-            },
-            "nda": {
-                "name": "Non-Disclosure Agreement",
-                "description": """Confidentiality agreement to protect sensitive business information.
+        "sections": (
+            "Partners", "Business Name and Nature", "Capital Contribution",
+            "Profit Sharing", "Management", "Decision Making",
+            "Addition/Removal of Partners", "Dissolution", "Dispute Resolution"
+        )
+    },
+    "nda": {
+        "name": "Non-Disclosure Agreement",
+        "description": """Confidentiality agreement to protect sensitive business information.
 • Defines what constitutes confidential information
 • Establishes obligations for both parties
 • Specifies duration of confidentiality obligations
 • Includes remedies for breach of confidentiality
 • Use before sharing business plans, trade secrets, or proprietary data""",
-                "sections": [
-                    "Parties", "Definition of Confidential Information", "Obligations",
-                    "Permitted Disclosures", "Term", "Return of Information",
-                    "Remedies", "Dispute Resolution"
-                ]
-            }
-        }
+        "sections": (
+            "Parties", "Definition of Confidential Information", "Obligations",
+            "Permitted Disclosures", "Term", "Return of Information",
+            "Remedies", "Dispute Resolution"
+        )
+    }
+}
+
+
+def _section_scaffold(sections) -> str:
+    """Build the empty-sections body used by the generic template layout"""
+    return "".join(f"\n{section}:\n[To be filled]\n" for section in sections)
+
+
+# Shared read-only by every generator, down to each template's entry
+_TEMPLATES = MappingProxyType({
+    key: MappingProxyType(info) for key, info in _TEMPLATE_DEFINITIONS.items()
+})
+
+# Precomputed generic-layout section scaffold per template type
+_SCAFFOLDS = MappingProxyType({
+    key: _section_scaffold(info["sections"]) for key, info in _TEMPLATE_DEFINITIONS.items()
+})
+
+
+def _compile_segments(fmt: str, defaults: Dict, aliases: Dict = None) -> Tuple:
+    """
+    Split a template format string into render segments
     
-    def generate_template(self, template_type: str, custom_fields: Dict = None) -> str:
-        """
-        Generate a contract template
+    Args:
+        fmt: Template body with named placeholders
+        defaults: Default value for each placeholder
+        aliases: Placeholders that read another field (with their own default)
         
-        Args:
-            template_type: Type of template to generate
-            custom_fields: Optional custom field values
-            
-        Returns:
-            Generated template text
-        """
-        if template_type not in self.templates:
-            return f"Template type '{template_type}' not found."
+    Returns:
+        Tuple of (literal, field key or None, default) triples
         
-        template_info = self.templates[template_type]
+    Raises:
+        ValueError: If a placeholder has no default, so renders never fail
+            or leak a bare 'None' for a missing field
+    """
+    aliases = aliases or _EMPTY
+    segments = []
+    for literal, name, _, _ in string.Formatter().parse(fmt):
+        if name and name not in defaults:
+            raise ValueError(f"Template placeholder '{name}' has no default")
+        segments.append((literal, aliases.get(name, name) if name else None, defaults.get(name)))
+    return tuple(segments)
+
+
+def _split_program(segments: Tuple) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Flatten compiled segments into parallel positional arrays
+    
+    Args:
+        segments: Output of _compile_segments
         
-        # Generate based on template type
-        if template_type == "employment_agreement":
-            return self._generate_employment_template(custom_fields)
-        elif template_type == "vendor_contract":
-            return self._generate_vendor_template(custom_fields)
-        elif template_type == "service_contract":
-            return self._generate_service_template(custom_fields)
-        elif template_type == "lease_agreement":
-            return self._generate_lease_template(custom_fields)
-        elif template_type == "partnership_deed":
-            return self._generate_partnership_template(custom_fields)
-        elif template_type == "nda":
-            return self._generate_nda_template(custom_fields)
-        else:
-            return self._generate_generic_template(template_info, custom_fields)
-    
-    def _generate_employment_template(self, fields: Dict = None) -> str:
-        """Generate employment agreement template"""
-        fields = fields or {}
+    Returns:
+        (literals, keys, defaults) where literals has one more entry than keys,
+        so field values slot in between consecutive literals
+    """
+    literals, keys, defaults = [""], [], []
+    for literal, key, default in segments:
+        literals[-1] += literal
+        if key is not None:
+            keys.append(key)
+            defaults.append(default)
+            literals.append("")
+    return tuple(literals), tuple(keys), tuple(defaults)
+
+
+def _fstring_literal(text: str) -> str:
+    """Escape literal text for the body of a double-quoted f-string"""
+    return json.dumps(text, ensure_ascii=False)[1:-1].replace("{", "{{").replace("}", "}}")
+
+
+def _compile_renderer(name: str, program: Tuple) -> Callable:
+    """
+    Generate a specialised render function for one template program
+    
+    The program is turned into a single f-string so each render is one
+    function call with no segment loop; non-string values are formatted
+    exactly as the original hand-written f-strings did.
+    
+    Args:
+        name: Template type, used in the code object's filename
+        program: (literals, keys, defaults) from _split_program
         
-        template = f"""EMPLOYMENT AGREEMENT
+    Returns:
+        Function taking a fields mapping and returning the template text
+    """
+    literals, keys, defaults = program
+    body = [_fstring_literal(literals[0])]
+    for i, key in enumerate(keys):
+        if not key.isidentifier():
+            raise ValueError(f"Template placeholder '{key}' is not a valid field name")
+        body.append(f"{{get({key!r}, _defaults[{i}])}}")
+        body.append(_fstring_literal(literals[i + 1]))
+    
+    source = (
+        "def render(fields, _defaults=_defaults):\n"
+        "    get = fields.get\n"
+        f'    return f"{"".join(body)}"\n'
+    )
+    namespace = {"_defaults": defaults}
+    exec(compile(source, f"<template:{name}>", "exec"), namespace)
+    return namespace["render"]
+
+
+@functools.lru_cache(maxsize=128)
+def _not_found(template_type: str) -> str:
+    """Message returned for an unknown template type (cached per type)"""
+    return f"Template type '{template_type}' not found."
+
+
+
+class TemplateGenerator:
+    """Generate standard contract templates"""
+    
+    # Clause text shared verbatim by several templates
+    _GOVERNING_LAW_HEADING = "9. GOVERNING LAW\n"
+    _SIGNATURE_LINE = "Signature: _________________              Signature: _________________\n"
+    _DATE_LINE = "Date: ______________________              Date: ______________________\n"
+    
+    # Template bodies; placeholders are compiled into render segments below.
+    # Defaults are frozen and shared, and repeated placeholder strings such
+    # as "[DATE]" are the same constant object across every template.
+    _EMPLOYMENT_FMT = """EMPLOYMENT AGREEMENT
 
-This Employment Agreement ("Agreement") is entered into on {fields.get('date', '[DATE]')} 
+This Employment Agreement ("Agreement") is entered into on {date} 
 between:
 
-1. {fields.get('employer_name', '[EMPLOYER NAME]')}, a company incorporated under the Companies Act, 2013, 
-   having its registered office at {fields.get('employer_address', '[EMPLOYER ADDRESS]')} 
+1. {employer_name}, a company incorporated under the Companies Act, 2013, 
+   having its registered office at {employer_address} 
    (hereinafter referred to as the "Employer")
 
 AND
 
-2. {fields.get('employee_name', '[EMPLOYEE NAME]')}, residing at {fields.get('employee_address', '[EMPLOYEE ADDRESS]')} 
+2. {employee_name}, residing at {employee_address} 
    (hereinafter referred to as the "Employee")
 
 1. POSITION AND DUTIES
-1.1 The Employee is appointed to the position of {fields.get('position', '[POSITION]')}.
-1.2 The Employee shall report to {fields.get('reporting_to', '[REPORTING MANAGER]')}.
+1.1 The Employee is appointed to the position of {position}.
+1.2 The Employee shall report to {reporting_to}.
 1.3 The Employee agrees to perform duties assigned and work in the best interests of the Employer.
 
 2. COMPENSATION
-2.1 The Employee shall receive a monthly salary of INR {fields.get('salary', '[AMOUNT]')}.
-2.2 Payment shall be made on or before the {fields.get('payment_day', '[DAY]')} of each month.
+2.1 The Employee shall receive a monthly salary of INR {salary}.
+2.2 Payment shall be made on or before the {payment_day} of each month.
 2.3 Salary is subject to applicable tax deductions as per Indian law.
 
 3. WORKING HOURS
-3.1 Standard working hours are {fields.get('working_hours', '[HOURS]')} per day, {fields.get('working_days', '[DAYS]')} days per week.
+3.1 Standard working hours are {working_hours} per day, {working_days} days per week.
 3.2 The Employee may be required to work additional hours as per business requirements.
 
 4. LEAVE POLICY
@@ -173,11 +253,11 @@ AND
 4.2 Leave must be applied for in advance and approved by the reporting manager.
 
 5. PROBATION PERIOD
-5.1 The Employee shall be on probation for {fields.get('probation_period', '3 months')}.
-5.2 During probation, either party may terminate with {fields.get('probation_notice', '15 days')} notice.
+5.1 The Employee shall be on probation for {probation_period}.
+5.2 During probation, either party may terminate with {probation_notice} notice.
 
 6. TERMINATION
-6.1 After probation, either party may terminate with {fields.get('notice_period', '30 days')} written notice.
+6.1 After probation, either party may terminate with {notice_period} written notice.
 6.2 The Employer may terminate immediately for cause including misconduct, breach of contract, or negligence.
 6.3 Upon termination, all company property must be returned.
 
@@ -187,12 +267,11 @@ AND
 7.3 Breach of confidentiality may result in legal action.
 
 8. NON-COMPETE (if applicable)
-8.1 During employment and for {fields.get('non_compete_period', '1 year')} after, the Employee shall not engage 
-    in competing business within {fields.get('non_compete_area', '[GEOGRAPHIC AREA]')}.
+8.1 During employment and for {non_compete_period} after, the Employee shall not engage 
+    in competing business within {non_compete_area}.
 
-9. GOVERNING LAW
-9.1 This Agreement shall be governed by the laws of India.
-9.2 Disputes shall be subject to the jurisdiction of {fields.get('jurisdiction', '[CITY]')} courts.
+""" + _GOVERNING_LAW_HEADING + """9.1 This Agreement shall be governed by the laws of India.
+9.2 Disputes shall be subject to the jurisdiction of {jurisdiction} courts.
 
 10. ENTIRE AGREEMENT
 This Agreement constitutes the entire agreement between the parties.
@@ -200,197 +279,268 @@ This Agreement constitutes the entire agreement between the parties.
 
 EMPLOYER:                                    EMPLOYEE:
 
-Name: {fields.get('employer_name', '[NAME]')}               Name: {fields.get('employee_name', '[NAME]')}
-Signature: _________________              Signature: _________________
-Date: ______________________              Date: ______________________
-"""
-        return template
+Name: {employer_signatory}               Name: {employee_signatory}
+""" + _SIGNATURE_LINE + _DATE_LINE
     
-    def _generate_vendor_template(self, fields: Dict = None) -> str:
-        """Generate vendor contract template"""
-        fields = fields or {}
-        
-        template = f"""VENDOR/SUPPLIER AGREEMENT
+    _EMPLOYMENT_DEFAULTS = MappingProxyType({
+        "date": "[DATE]",
+        "employer_name": "[EMPLOYER NAME]",
+        "employer_address": "[EMPLOYER ADDRESS]",
+        "employee_name": "[EMPLOYEE NAME]",
+        "employee_address": "[EMPLOYEE ADDRESS]",
+        "position": "[POSITION]",
+        "reporting_to": "[REPORTING MANAGER]",
+        "salary": "[AMOUNT]",
+        "payment_day": "[DAY]",
+        "working_hours": "[HOURS]",
+        "working_days": "[DAYS]",
+        "probation_period": "3 months",
+        "probation_notice": "15 days",
+        "notice_period": "30 days",
+        "non_compete_period": "1 year",
+        "non_compete_area": "[GEOGRAPHIC AREA]",
+        "jurisdiction": "[CITY]",
+        "employer_signatory": "[NAME]",
+        "employee_signatory": "[NAME]"
+    })
+    
+    # The signature block repeats the party names with a shorter default
+    _EMPLOYMENT_SEGMENTS = _compile_segments(_EMPLOYMENT_FMT, _EMPLOYMENT_DEFAULTS, {
+        "employer_signatory": "employer_name",
+        "employee_signatory": "employee_name"
+    })
+    
+    _VENDOR_FMT = """VENDOR/SUPPLIER AGREEMENT
 
-This Agreement is made on {fields.get('date', '[DATE]')} between:
+This Agreement is made on {date} between:
 
-BUYER: {fields.get('buyer_name', '[BUYER NAME]')}
-Address: {fields.get('buyer_address', '[BUYER ADDRESS]')}
+BUYER: {buyer_name}
+Address: {buyer_address}
 
-VENDOR: {fields.get('vendor_name', '[VENDOR NAME]')}
-Address: {fields.get('vendor_address', '[VENDOR ADDRESS]')}
+VENDOR: {vendor_name}
+Address: {vendor_address}
 
 1. SCOPE OF SUPPLY
-The Vendor agrees to supply {fields.get('products_services', '[PRODUCTS/SERVICES]')} 
+The Vendor agrees to supply {products_services} 
 as per specifications agreed upon.
 
 2. PRICING
-2.1 Price: INR {fields.get('price', '[AMOUNT]')} per {fields.get('unit', '[UNIT]')}
+2.1 Price: INR {price} per {unit}
 2.2 Prices are exclusive of applicable taxes unless stated otherwise.
 2.3 Price revisions require 30 days advance written notice.
 
 3. PAYMENT TERMS
-3.1 Payment Terms: {fields.get('payment_terms', 'Net 30 days from invoice date')}
-3.2 Payment method: {fields.get('payment_method', 'Bank transfer')}
-3.3 Late payments shall attract interest at {fields.get('late_payment_rate', '12% per annum')}.
+3.1 Payment Terms: {payment_terms}
+3.2 Payment method: {payment_method}
+3.3 Late payments shall attract interest at {late_payment_rate}.
 
 4. DELIVERY
-4.1 Delivery Timeline: {fields.get('delivery_time', '[TIMELINE]')}
-4.2 Delivery Location: {fields.get('delivery_location', '[LOCATION]')}
+4.1 Delivery Timeline: {delivery_time}
+4.2 Delivery Location: {delivery_location}
 4.3 Risk passes to Buyer upon delivery and acceptance.
 
 5. QUALITY STANDARDS
 5.1 All supplies must meet agreed specifications and quality standards.
 5.2 Buyer reserves the right to inspect and reject non-conforming goods.
-5.3 Defective goods shall be replaced at Vendor's cost within {fields.get('replacement_time', '7 days')}.
+5.3 Defective goods shall be replaced at Vendor's cost within {replacement_time}.
 
 6. WARRANTIES
 6.1 Vendor warrants that supplies are free from defects.
-6.2 Warranty period: {fields.get('warranty_period', '12 months')} from delivery.
+6.2 Warranty period: {warranty_period} from delivery.
 
 7. LIABILITY
 7.1 Vendor's total liability is limited to the value of the defective goods/services.
 7.2 Neither party is liable for indirect or consequential damages.
 
 8. TERM AND TERMINATION
-8.1 Term: {fields.get('contract_term', '1 year')} from the date of this Agreement.
-8.2 Either party may terminate with {fields.get('termination_notice', '30 days')} written notice.
+8.1 Term: {contract_term} from the date of this Agreement.
+8.2 Either party may terminate with {termination_notice} written notice.
 8.3 Immediate termination allowed for material breach not cured within 15 days.
 
-9. GOVERNING LAW
-Governed by Indian law. Jurisdiction: {fields.get('jurisdiction', '[CITY]')} courts.
+""" + _GOVERNING_LAW_HEADING + """Governed by Indian law. Jurisdiction: {jurisdiction} courts.
 
 
 BUYER:                                    VENDOR:
-Signature: _________________              Signature: _________________
-Date: ______________________              Date: ______________________
-"""
-        return template
+""" + _SIGNATURE_LINE + _DATE_LINE
     
-    def _generate_service_template(self, fields: Dict = None) -> str:
-        """Generate service agreement template"""
-        fields = fields or {}
-        
-        template = f"""SERVICE AGREEMENT
+    _VENDOR_DEFAULTS = MappingProxyType({
+        "date": "[DATE]",
+        "buyer_name": "[BUYER NAME]",
+        "buyer_address": "[BUYER ADDRESS]",
+        "vendor_name": "[VENDOR NAME]",
+        "vendor_address": "[VENDOR ADDRESS]",
+        "products_services": "[PRODUCTS/SERVICES]",
+        "price": "[AMOUNT]",
+        "unit": "[UNIT]",
+        "payment_terms": "Net 30 days from invoice date",
+        "payment_method": "Bank transfer",
+        "late_payment_rate": "12% per annum",
+        "delivery_time": "[TIMELINE]",
+        "delivery_location": "[LOCATION]",
+        "replacement_time": "7 days",
+        "warranty_period": "12 months",
+        "contract_term": "1 year",
+        "termination_notice": "30 days",
+        "jurisdiction": "[CITY]"
+    })
+    
+    _VENDOR_SEGMENTS = _compile_segments(_VENDOR_FMT, _VENDOR_DEFAULTS)
+    
+    _SERVICE_FMT = """SERVICE AGREEMENT
 
-Date: {fields.get('date', '[DATE]')}
+Date: {date}
 
-CLIENT: {fields.get('client_name', '[CLIENT NAME]')}
-SERVICE PROVIDER: {fields.get('provider_name', '[PROVIDER NAME]')}
+CLIENT: {client_name}
+SERVICE PROVIDER: {provider_name}
 
 1. SERVICES
 The Service Provider shall provide the following services:
-{fields.get('services_description', '[DETAILED DESCRIPTION OF SERVICES]')}
+{services_description}
 
 2. DELIVERABLES
 Expected deliverables include:
-{fields.get('deliverables', '[LIST OF DELIVERABLES]')}
+{deliverables}
 
 3. TIMELINE
-Project Start: {fields.get('start_date', '[DATE]')}
-Project End: {fields.get('end_date', '[DATE]')}
-Key Milestones: {fields.get('milestones', '[MILESTONES]')}
+Project Start: {start_date}
+Project End: {end_date}
+Key Milestones: {milestones}
 
 4. FEES AND PAYMENT
-4.1 Total Fee: INR {fields.get('total_fee', '[AMOUNT]')}
+4.1 Total Fee: INR {total_fee}
 4.2 Payment Schedule:
-    - {fields.get('payment_schedule', 'Milestone-based or monthly')}
-4.3 Payment within {fields.get('payment_days', '15 days')} of invoice.
+    - {payment_schedule}
+4.3 Payment within {payment_days} of invoice.
 
 5. INTELLECTUAL PROPERTY
-5.1 All IP created shall belong to {fields.get('ip_owner', 'Client')}.
+5.1 All IP created shall belong to {ip_owner}.
 5.2 Provider retains rights to pre-existing IP and general methodologies.
 
 6. CONFIDENTIALITY
 Both parties agree to maintain confidentiality of shared information.
 
 7. LIABILITY
-Maximum liability limited to {fields.get('liability_cap', 'total fees paid')}.
+Maximum liability limited to {liability_cap}.
 
 8. TERMINATION
-Either party may terminate with {fields.get('termination_notice', '30 days')} notice.
+Either party may terminate with {termination_notice} notice.
 
-9. GOVERNING LAW
-Indian law. Jurisdiction: {fields.get('jurisdiction', '[CITY]')}.
+""" + _GOVERNING_LAW_HEADING + """Indian law. Jurisdiction: {jurisdiction}.
 
 
 CLIENT:                                    SERVICE PROVIDER:
-Signature: _________________              Signature: _________________
-"""
-        return template
+""" + _SIGNATURE_LINE
     
-    def _generate_lease_template(self, fields: Dict = None) -> str:
-        """Generate lease agreement template"""
-        fields = fields or {}
-        
-        return f"""COMMERCIAL LEASE AGREEMENT
+    _SERVICE_DEFAULTS = MappingProxyType({
+        "date": "[DATE]",
+        "client_name": "[CLIENT NAME]",
+        "provider_name": "[PROVIDER NAME]",
+        "services_description": "[DETAILED DESCRIPTION OF SERVICES]",
+        "deliverables": "[LIST OF DELIVERABLES]",
+        "start_date": "[DATE]",
+        "end_date": "[DATE]",
+        "milestones": "[MILESTONES]",
+        "total_fee": "[AMOUNT]",
+        "payment_schedule": "Milestone-based or monthly",
+        "payment_days": "15 days",
+        "ip_owner": "Client",
+        "liability_cap": "total fees paid",
+        "termination_notice": "30 days",
+        "jurisdiction": "[CITY]"
+    })
+    
+    _SERVICE_SEGMENTS = _compile_segments(_SERVICE_FMT, _SERVICE_DEFAULTS)
+    
+    _LEASE_FMT = """COMMERCIAL LEASE AGREEMENT
 
-LANDLORD: {fields.get('landlord_name', '[NAME]')}
-TENANT: {fields.get('tenant_name', '[NAME]')}
+LANDLORD: {landlord_name}
+TENANT: {tenant_name}
 
 1. PROPERTY
-Address: {fields.get('property_address', '[ADDRESS]')}
-Area: {fields.get('property_area', '[AREA]')}
+Address: {property_address}
+Area: {property_area}
 
 2. LEASE TERM
-Period: {fields.get('lease_period', '[PERIOD]')} 
-From: {fields.get('start_date', '[DATE]')}
+Period: {lease_period} 
+From: {start_date}
 
 3. RENT
-Monthly Rent: INR {fields.get('rent_amount', '[AMOUNT]')}
-Security Deposit: INR {fields.get('deposit_amount', '[AMOUNT]')}
+Monthly Rent: INR {rent_amount}
+Security Deposit: INR {deposit_amount}
 
 4. PAYMENT
-Rent due on {fields.get('rent_day', '[DAY]')} of each month.
+Rent due on {rent_day} of each month.
 
 5. USE OF PREMISES
-For: {fields.get('permitted_use', '[PURPOSE]')} only.
+For: {permitted_use} only.
 
 6. MAINTENANCE
-Tenant responsible for: {fields.get('tenant_maintenance', '[ITEMS]')}
-Landlord responsible for: {fields.get('landlord_maintenance', '[ITEMS]')}
+Tenant responsible for: {tenant_maintenance}
+Landlord responsible for: {landlord_maintenance}
 
 7. TERMINATION
-Notice period: {fields.get('notice_period', '2 months')}
+Notice period: {notice_period}
 
 LANDLORD:                    TENANT:
 Signature: _____________     Signature: _____________
 """
     
-    def _generate_partnership_template(self, fields: Dict = None) -> str:
-        """Generate partnership deed template"""
-        fields = fields or {}
-        
-        return f"""PARTNERSHIP DEED
+    _LEASE_DEFAULTS = MappingProxyType({
+        "landlord_name": "[NAME]",
+        "tenant_name": "[NAME]",
+        "property_address": "[ADDRESS]",
+        "property_area": "[AREA]",
+        "lease_period": "[PERIOD]",
+        "start_date": "[DATE]",
+        "rent_amount": "[AMOUNT]",
+        "deposit_amount": "[AMOUNT]",
+        "rent_day": "[DAY]",
+        "permitted_use": "[PURPOSE]",
+        "tenant_maintenance": "[ITEMS]",
+        "landlord_maintenance": "[ITEMS]",
+        "notice_period": "2 months"
+    })
+    
+    _LEASE_SEGMENTS = _compile_segments(_LEASE_FMT, _LEASE_DEFAULTS)
+    
+    _PARTNERSHIP_FMT = """PARTNERSHIP DEED
 
 Partners:
-{fields.get('partners', '[PARTNER NAMES]')}
+{partners}
 
 1. BUSINESS
-Name: {fields.get('business_name', '[NAME]')}
-Nature: {fields.get('business_nature', '[NATURE]')}
+Name: {business_name}
+Nature: {business_nature}
 
 2. CAPITAL
-{fields.get('capital_details', '[CAPITAL CONTRIBUTION BY EACH PARTNER]')}
+{capital_details}
 
 3. PROFIT SHARING
-{fields.get('profit_sharing', '[PROFIT SHARING RATIO]')}
+{profit_sharing}
 
 4. MANAGEMENT
-{fields.get('management_structure', '[MANAGEMENT DETAILS]')}
+{management_structure}
 
 5. DISSOLUTION
-{fields.get('dissolution_terms', '[DISSOLUTION TERMS]')}
+{dissolution_terms}
 """
     
-    def _generate_nda_template(self, fields: Dict = None) -> str:
-        """Generate NDA template"""
-        fields = fields or {}
-        
-        return f"""NON-DISCLOSURE AGREEMENT
+    _PARTNERSHIP_DEFAULTS = MappingProxyType({
+        "partners": "[PARTNER NAMES]",
+        "business_name": "[NAME]",
+        "business_nature": "[NATURE]",
+        "capital_details": "[CAPITAL CONTRIBUTION BY EACH PARTNER]",
+        "profit_sharing": "[PROFIT SHARING RATIO]",
+        "management_structure": "[MANAGEMENT DETAILS]",
+        "dissolution_terms": "[DISSOLUTION TERMS]"
+    })
+    
+    _PARTNERSHIP_SEGMENTS = _compile_segments(_PARTNERSHIP_FMT, _PARTNERSHIP_DEFAULTS)
+    
+    _NDA_FMT = """NON-DISCLOSURE AGREEMENT
 
-DISCLOSING PARTY: {fields.get('disclosing_party', '[NAME]')}
-RECEIVING PARTY: {fields.get('receiving_party', '[NAME]')}
+DISCLOSING PARTY: {disclosing_party}
+RECEIVING PARTY: {receiving_party}
 
 1. CONFIDENTIAL INFORMATION
 All information shared is confidential.
@@ -399,7 +549,7 @@ All information shared is confidential.
 Receiving Party shall not disclose or use confidential information.
 
 3. TERM
-Duration: {fields.get('term', '2 years')} from date of disclosure.
+Duration: {term} from date of disclosure.
 
 4. EXCLUSIONS
 Does not include publicly available information.
@@ -408,35 +558,181 @@ SIGNATURES:
 _________________    _________________
 """
     
-    def _generate_generic_template(self, template_info: Dict, fields: Dict = None) -> str:
-        """Generate generic template structure"""
-        template = f"""{template_info['name'].upper()}
+    _NDA_DEFAULTS = MappingProxyType({
+        "disclosing_party": "[NAME]",
+        "receiving_party": "[NAME]",
+        "term": "2 years"
+    })
+    
+    _NDA_SEGMENTS = _compile_segments(_NDA_FMT, _NDA_DEFAULTS)
+    
+    # Compiled segments for each template type
+    _SEGMENTS: ClassVar[Dict[str, Tuple]] = {
+        "employment_agreement": _EMPLOYMENT_SEGMENTS,
+        "vendor_contract": _VENDOR_SEGMENTS,
+        "service_contract": _SERVICE_SEGMENTS,
+        "lease_agreement": _LEASE_SEGMENTS,
+        "partnership_deed": _PARTNERSHIP_SEGMENTS,
+        "nda": _NDA_SEGMENTS
+    }
+    
+    # Render programs as parallel (literals, keys, defaults) arrays indexed by
+    # integer template id, each compiled once into a specialised f-string
+    # function; write_template streams from the programs directly
+    _TEMPLATE_IDS: ClassVar[Dict[str, int]] = {name: i for i, name in enumerate(_SEGMENTS)}
+    _PROGRAMS: ClassVar[Tuple] = tuple(_split_program(segments) for segments in _SEGMENTS.values())
+    _RENDERERS: ClassVar[Tuple[Callable, ...]] = tuple(
+        _compile_renderer(name, program) for name, program in zip(_TEMPLATE_IDS, _PROGRAMS)
+    )
+    
+    # Required fields for each template type
+    _TEMPLATE_FIELDS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "employment_agreement": (
+            "employer_name", "employer_address", "employee_name", "employee_address",
+            "position", "salary", "working_hours", "notice_period", "jurisdiction"
+        ),
+        "vendor_contract": (
+            "buyer_name", "vendor_name", "products_services", "price",
+            "payment_terms", "delivery_time", "contract_term"
+        ),
+        "service_contract": (
+            "client_name", "provider_name", "services_description", "total_fee",
+            "start_date", "end_date", "deliverables"
+        ),
+        "lease_agreement": (
+            "landlord_name", "tenant_name", "property_address", "rent_amount",
+            "deposit_amount", "lease_period", "start_date"
+        ),
+        "partnership_deed": (
+            "partners", "business_name", "business_nature", "capital_details",
+            "profit_sharing"
+        ),
+        "nda": (
+            "disclosing_party", "receiving_party", "term"
+        )
+    }
+    
+    def __init__(self):
+        """Initialize template generator"""
+        self.templates = _TEMPLATES
+    
+    @functools.cached_property
+    def _templates_list(self) -> Tuple[Mapping, ...]:
+        """Template listing, built on first use since it never changes (read-only)"""
+        return tuple(
+            MappingProxyType({
+                "id": key,
+                "name": value["name"],
+                "description": value["description"],
+                "sections": len(value["sections"])
+            })
+            for key, value in self.templates.items()
+        )
+    
+    @functools.cached_property
+    def _render_cached(self) -> Callable:
+        """Per-instance render cache so repeat previews skip formatting"""
+        return functools.lru_cache(maxsize=256)(self._render_items)
+    
+    def generate_template(self, template_type: str, custom_fields: Dict = None) -> str:
+        """
+        Generate a contract template
+        
+        Args:
+            template_type: Type of template to generate
+            custom_fields: Optional custom field values
+            
+        Returns:
+            Generated template text
+        """
+        if template_type not in self.templates:
+            return _not_found(template_type)
+        
+        if not custom_fields:
+            return self._render_cached(template_type, ())
+        
+        try:
+            items = tuple(sorted(custom_fields.items()))
+        except TypeError:
+            return self._render(template_type, custom_fields)
+        
+        # Only plain string values are cached; anything else may be
+        # unhashable or compare equal across types (1 == True)
+        if all(type(value) is str for _, value in items):
+            return self._render_cached(template_type, items)
+        return self._render(template_type, custom_fields)
+    
+    def write_template(self, template_type: str, write: Callable[[str], object],
+                       custom_fields: Dict = None) -> None:
+        """
+        Stream a contract template to a writer without building the full text
+        
+        Args:
+            template_type: Type of template to generate
+            write: Callable receiving successive text chunks (e.g. a file or
+                StringIO write method, or a streaming response writer)
+            custom_fields: Optional custom field values
+        """
+        template_id = self._TEMPLATE_IDS.get(template_type)
+        if template_id is None:
+            write(self.generate_template(template_type, custom_fields))
+            return
+        
+        literals = self._PROGRAMS[template_id][0]
+        for literal, value in zip(literals, self._field_values(template_id, custom_fields)):
+            write(literal)
+            write(value)
+        write(literals[-1])
+    
+    def _render_items(self, template_type: str, items: Tuple) -> str:
+        """Render from a hashable tuple of field items (cache entry point)"""
+        return self._render(template_type, dict(items) if items else _EMPTY)
+    
+    def _render(self, template_type: str, custom_fields: Dict = None) -> str:
+        """Dispatch to the renderer for a known template type"""
+        template_id = self._TEMPLATE_IDS.get(template_type)
+        if template_id is None:
+            return self._generate_generic_template(
+                self.templates[template_type], custom_fields, _SCAFFOLDS.get(template_type)
+            )
+        return self._exec(template_id, custom_fields)
+    
+    @classmethod
+    def _field_values(cls, template_id: int, fields: Dict = None) -> Tuple[str, ...]:
+        """Resolve a template's field values in placeholder order"""
+        _, keys, defaults = cls._PROGRAMS[template_id]
+        if not fields:
+            return defaults
+        return tuple(
+            value if type(value) is str else format(value)
+            for value in map(fields.get, keys, defaults)
+        )
+    
+    @classmethod
+    def _exec(cls, template_id: int, fields: Dict = None) -> str:
+        """Render a template through its compiled render function"""
+        return cls._RENDERERS[template_id](fields or _EMPTY)
+    
+    def _generate_generic_template(self, template_info: Dict, fields: Dict = None,
+                                   scaffold: str = None) -> str:
+        """Generate generic template structure, from a precomputed scaffold when given"""
+        sections = scaffold if scaffold is not None else _section_scaffold(template_info['sections'])
+        
+        return f"""{template_info['name'].upper()}
 
 Description: {template_info['description']}
 
 SECTIONS:
-"""
-        for section in template_info['sections']:
-            template += f"\n{section}:\n[To be filled]\n"
-        
-        return template
+{sections}"""
     
     def list_available_templates(self) -> List[Dict]:
         """
         List all available templates
         
         Returns:
-            List of template info dictionaries
+            List of template info dictionaries (fresh copies the caller may modify)
         """
-        return [
-            {
-                "id": key,
-                "name": value["name"],
-                "description": value["description"],
-                "sections": len(value["sections"])
-            }
-            for key, value in self.templates.items()
-        ]
+        return [dict(info) for info in self._templates_list]
     
     def get_template_fields(self, template_type: str) -> List[str]:
         """
@@ -445,31 +741,4 @@ SECTIONS:
         Returns:
             List of field names
         """
-        # Define required fields for each template type
-        template_fields = {
-            "employment_agreement": [
-                "employer_name", "employer_address", "employee_name", "employee_address",
-                "position", "salary", "working_hours", "notice_period", "jurisdiction"
-            ],
-            "vendor_contract": [
-                "buyer_name", "vendor_name", "products_services", "price",
-                "payment_terms", "delivery_time", "contract_term"
-            ],
-            "service_contract": [
-                "client_name", "provider_name", "services_description", "total_fee",
-                "start_date", "end_date", "deliverables"
-            ],
-            "lease_agreement": [
-                "landlord_name", "tenant_name", "property_address", "rent_amount",
-                "deposit_amount", "lease_period", "start_date"
-            ],
-            "partnership_deed": [
-                "partners", "business_name", "business_nature", "capital_details",
-                "profit_sharing"
-            ],
-            "nda": [
-                "disclosing_party", "receiving_party", "term"
-            ]
-        }
-        
-        return template_fields.get(template_type, [])
+        return list(self._TEMPLATE_FIELDS.get(template_type, ()))